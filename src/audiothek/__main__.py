@@ -6,8 +6,6 @@ from dataclasses import dataclass
 from audiothek import AudiothekDownloader
 from audiothek.utils import migrate_folders
 
-logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]%(message)s")
-
 
 @dataclass
 class DownloadRequest:
@@ -29,6 +27,8 @@ class DownloadRequest:
 
 def main() -> None:
     """Parse command line arguments and download episodes from ARD Audiothek."""
+    # Configure logging only when run as a program, not as a side effect of importing this module
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]%(message)s")
     parser = argparse.ArgumentParser(description="ARD Audiothek downloader.")
     group = parser.add_mutually_exclusive_group(required=True)
     group.add_argument(
@@ -135,34 +135,38 @@ def _process_request(request: DownloadRequest) -> None:
         cache_dir=request.cache_dir,
     )
 
-    if request.migrate_folders_flag:
-        migrate_folders(request.folder, downloader, downloader.logger)
-        return
-
-    if request.update_folders:
-        downloader.update_all_folders(request.folder)
-        return
-
-    if request.remove_lower_quality:
-        downloader.remove_lower_quality_files(request.folder, dry_run=request.dry_run)
-        return
-
-    if request.editorial_category_id:
-        if request.search_type in {"program-sets", "all"}:
-            program_sets = downloader.client.find_program_sets_by_editorial_category_id(request.editorial_category_id)
-            for program_set in program_sets:
-                print(program_set)
-
-        if request.search_type in {"collections", "all"}:
-            collections = downloader.client.find_editorial_collections_by_editorial_category_id(request.editorial_category_id)
-            for collection in collections:
-                print(collection)
-        return
-
-    if request.id:
-        downloader.download_from_id(request.id, request.folder)
-    else:
-        downloader.download_from_url(request.url, request.folder)
+    try:
+        if request.migrate_folders_flag:
+            migrate_folders(request.folder, downloader, downloader.logger)
+            return
+
+        if request.update_folders:
+            downloader.update_all_folders(request.folder)
+            return
+
+        if request.remove_lower_quality:
+            downloader.remove_lower_quality_files(request.folder, dry_run=request.dry_run)
+            return
+
+        if request.editorial_category_id:
+            if request.search_type in {"program-sets", "all"}:
+                program_sets = downloader.client.find_program_sets_by_editorial_category_id(request.editorial_category_id)
+                for program_set in program_sets:
+                    print(program_set)
+
+            if request.search_type in {"collections", "all"}:
+                collections = downloader.client.find_editorial_collections_by_editorial_category_id(request.editorial_category_id)
+                for collection in collections:
+                    print(collection)
+            return
+
+        if request.id:
+            downloader.download_from_id(request.id, request.folder)
+        else:
+            downloader.download_from_url(request.url, request.folder)
+    finally:
+        # Release pooled HTTP and cache database connections instead of leaving them to interpreter teardown
+        downloader.close()
 
 
 if __name__ == "__main__":
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import contextlib
 import hashlib
 import json
 import logging
@@ -9,11 +10,26 @@ import os
 import sqlite3
 import threading
 import time
+import zlib
+from collections.abc import Iterable, Iterator, Mapping
 from pathlib import Path
 from typing import Any
 
 from .file_utils import ensure_directory_exists
 
+# zlib level for stored responses: GraphQL JSON repeats field names heavily, so even the fastest level shrinks it several-fold
+ZLIB_LEVEL = 1
+
+# Per-query TTL overrides: category listings change slowly, episode details (availability, audio URLs) more often
+QUERY_TTL_SECONDS: Mapping[str, int] = {
+    "EditorialCategoryCollections": 24 * 60 * 60,
+    "ProgramSetsByEditorialCategoryId": 24 * 60 * 60,
+    "EpisodeQuery": 60 * 60,
+}
+
+# (query, variables, response, query_name), as accepted by GraphQLCache.set
+CacheEntry = tuple[str, dict[str, Any], dict[str, Any], str]
+
 
 class GraphQLCache:
     """SQLite-backed cache for GraphQL responses."""
@@ -24,16 +40,19 @@ class GraphQLCache:
         ttl_seconds: int = 6 * 60 * 60,
         logger: logging.Logger | None = None,
         enabled: bool | None = None,
+        query_ttl_seconds: Mapping[str, int] | None = None,
     ) -> None:
         """Initialize the cache.
 
         Args:
             cache_dir: Directory where the cache database should be stored. Defaults to
                 ``$XDG_CACHE_HOME/audiothek-downloader`` or ``~/.cache/audiothek-downloader``.
-            ttl_seconds: Time-to-live for cached entries.
+            ttl_seconds: Time-to-live for entries of queries without an override. Zero disables caching.
             logger: Logger instance to use for informational messages.
             enabled: Force enable/disable caching. When None, respects the
                 ``AUDIOTHEK_DISABLE_CACHE`` environment variable.
+            query_ttl_seconds: Time-to-live overrides by query name, which may be shorter or longer
+                than ``ttl_seconds``. Defaults to ``QUERY_TTL_SECONDS``.
 
         """
         self.logger = logger or logging.getLogger(__name__)
@@ -46,7 +65,15 @@ class GraphQLCache:
             self._enabled = enabled
 
         self.ttl_seconds = max(0, int(ttl_seconds)) if self._enabled else 0
+        self.query_ttl_seconds = dict(QUERY_TTL_SECONDS if query_ttl_seconds is None else query_ttl_seconds)
         self._lock = threading.Lock()
+        # Connections are pooled and shared across threads; all opened ones are tracked so close() reaches every one
+        self._pool_lock = threading.Lock()
+        self._connections: list[sqlite3.Connection] = []
+        self._idle_connections: list[sqlite3.Connection] = []
+        self._expired_removed = False
+        # Per-thread buffer of the batch() the thread opened or joined; other threads keep writing immediately
+        self._local = threading.local()
         if self.ttl_seconds > 0:
             ensure_directory_exists(str(base_dir), self.logger)
             self._initialize_database()
@@ -61,7 +88,7 @@ class GraphQLCache:
         return Path.home() / ".cache" / "audiothek-downloader"
 
     def _initialize_database(self) -> None:
-        with self._connect() as conn:
+        with self._connect() as conn, conn:
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS graphql_cache (
@@ -70,45 +97,79 @@ class GraphQLCache:
                     query TEXT NOT NULL,
                     variables TEXT NOT NULL,
                     response TEXT NOT NULL,
-                    updated_at REAL NOT NULL
+                    updated_at REAL NOT NULL,
+                    expires_at REAL NOT NULL
                 )
                 """
             )
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(graphql_cache)")}
+            if "expires_at" not in columns:
+                # Databases created before expires_at existed: derive it from updated_at
+                conn.execute("ALTER TABLE graphql_cache ADD COLUMN expires_at REAL NOT NULL DEFAULT 0")
+                conn.execute("UPDATE graphql_cache SET expires_at = updated_at + ?", (self.ttl_seconds,))
             conn.execute(
                 """
                 CREATE INDEX IF NOT EXISTS idx_graphql_cache_updated_at
                 ON graphql_cache(updated_at)
                 """
             )
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_graphql_cache_expires_at
+                ON graphql_cache(expires_at)
+                """
+            )
             conn.commit()
 
-    def _connect(self) -> sqlite3.Connection:
-        return sqlite3.connect(self.cache_path, check_same_thread=False)
+    @contextlib.contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a pooled connection, opening a new one only when all pooled connections are in use."""
+        with self._pool_lock:
+            conn = self._idle_connections.pop() if self._idle_connections else None
+        if conn is None:
+            conn = sqlite3.connect(self.cache_path, check_same_thread=False)
+            # WAL lets readers proceed while another thread writes; NORMAL sync is safe with WAL
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with self._pool_lock:
+                self._connections.append(conn)
+        try:
+            yield conn
+        finally:
+            with self._pool_lock:
+                # A connection closed by close() while borrowed is not handed out again
+                if conn in self._connections:
+                    self._idle_connections.append(conn)
+
+    def close(self) -> None:
+        """Close every database connection the cache has opened; later operations reconnect lazily."""
+        with self._pool_lock:
+            connections, self._connections, self._idle_connections = self._connections, [], []
+        for conn in connections:
+            conn.close()
 
     def get(self, query: str, variables: dict[str, Any], _query_name: str = "") -> dict[str, Any] | None:
         """Return cached GraphQL response if it exists and is fresh."""
         if self.ttl_seconds <= 0:
             return None
 
+        if not self._expired_removed:
+            self.remove_expired()
+
         cache_key = self._build_cache_key(query, variables)
-        with self._lock:
-            with self._connect() as conn:
-                row = conn.execute(
-                    "SELECT response, updated_at FROM graphql_cache WHERE cache_key = ?",
-                    (cache_key,),
-                ).fetchone()
+        # Reads take no writer lock: a borrowed connection is used by one thread at a time and WAL gives readers a consistent snapshot
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT response FROM graphql_cache WHERE cache_key = ? AND expires_at > ?",
+                (cache_key, time.time()),
+            ).fetchone()
 
         if not row:
             return None
 
-        updated_at = float(row[1])
-        if time.time() - updated_at > self.ttl_seconds:
-            self._evict(cache_key)
-            return None
-
         try:
-            return json.loads(row[0])
-        except json.JSONDecodeError:
+            return self._decode_response(row[0])
+        except (json.JSONDecodeError, zlib.error):
             self._evict(cache_key)
             return None
 
@@ -117,22 +178,73 @@ class GraphQLCache:
         if self.ttl_seconds <= 0:
             return
 
-        cache_key = self._build_cache_key(query, variables)
-        payload = json.dumps(response, separators=(",", ":"), ensure_ascii=False)
+        pending = getattr(self._local, "pending", None)
+        if pending is not None:
+            pending.append((query, variables, response, query_name))
+            return
+        self.set_many([(query, variables, response, query_name)])
+
+    @contextlib.contextmanager
+    def batch(self, pending: list[CacheEntry] | None = None) -> Iterator[list[CacheEntry]]:
+        """Buffer the calling thread's ``set`` calls and write them in one transaction.
+
+        Only threads inside the batch defer their writes. A nested batch on the same
+        thread joins the outer one, which writes everything when it ends.
+
+        Args:
+            pending: Buffer yielded by a batch opened on another thread. Worker threads
+                pass it to add their writes to that batch; its owner writes them.
+
+        Yields:
+            The buffer collecting the batch's entries
+
+        """
+        outer = getattr(self._local, "pending", None)
+        owns_buffer = pending is None and outer is None
+        if pending is None:
+            pending = [] if outer is None else outer
+        self._local.pending = pending
+        try:
+            yield pending
+        finally:
+            self._local.pending = outer
+            if owns_buffer:
+                self.set_many(pending)
+
+    def set_many(self, entries: Iterable[CacheEntry]) -> None:
+        """Persist several GraphQL responses in a single transaction."""
+        if self.ttl_seconds <= 0:
+            return
+
         timestamp = time.time()
+        rows = [
+            (
+                self._build_cache_key(query, variables),
+                query_name,
+                query,
+                self._serialize_variables(variables),
+                self._encode_response(response),
+                timestamp,
+                timestamp + self.query_ttl_seconds.get(query_name, self.ttl_seconds),
+            )
+            for query, variables, response, query_name in entries
+        ]
+        if not rows:
+            return
 
         with self._lock:
-            with self._connect() as conn:
-                conn.execute(
+            with self._connect() as conn, conn:
+                conn.executemany(
                     """
-                    INSERT INTO graphql_cache(cache_key, query_name, query, variables, response, updated_at)
-                    VALUES (?, ?, ?, ?, ?, ?)
+                    INSERT INTO graphql_cache(cache_key, query_name, query, variables, response, updated_at, expires_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
                     ON CONFLICT(cache_key) DO UPDATE SET
                         response=excluded.response,
                         updated_at=excluded.updated_at,
+                        expires_at=excluded.expires_at,
                         query_name=excluded.query_name
                     """,
-                    (cache_key, query_name, query, self._serialize_variables(variables), payload, timestamp),
+                    rows,
                 )
                 conn.commit()
 
@@ -142,27 +254,49 @@ class GraphQLCache:
             return
 
         with self._lock:
-            with self._connect() as conn:
+            with self._connect() as conn, conn:
                 conn.execute("DELETE FROM graphql_cache")
                 conn.commit()
 
+    def remove_expired(self) -> None:
+        """Remove all expired entries in a single sweep."""
+        if self.ttl_seconds <= 0:
+            return
+
+        with self._lock:
+            self._expired_removed = True
+            with self._connect() as conn, conn:
+                conn.execute("DELETE FROM graphql_cache WHERE expires_at <= ?", (time.time(),))
+                conn.commit()
+
     def _evict(self, cache_key: str) -> None:
         if self.ttl_seconds <= 0:
             return
 
         with self._lock:
-            with self._connect() as conn:
+            with self._connect() as conn, conn:
                 conn.execute("DELETE FROM graphql_cache WHERE cache_key = ?", (cache_key,))
                 conn.commit()
 
+    @staticmethod
+    def _encode_response(response: dict[str, Any]) -> bytes:
+        return zlib.compress(json.dumps(response, separators=(",", ":"), ensure_ascii=False).encode("utf-8"), ZLIB_LEVEL)
+
+    @staticmethod
+    def _decode_response(payload: bytes | str) -> dict[str, Any]:
+        # Rows written before responses were compressed hold plain JSON text
+        if isinstance(payload, str):
+            return json.loads(payload)
+        return json.loads(zlib.decompress(payload))
+
     @staticmethod
     def _serialize_variables(variables: dict[str, Any]) -> str:
         return json.dumps(variables, sort_keys=True, separators=(",", ":"))
 
     def _build_cache_key(self, query: str, variables: dict[str, Any]) -> str:
-        serialized = json.dumps(
-            {"query": query, "variables": variables},
-            sort_keys=True,
-            separators=(",", ":"),
-        )
-        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+        # 128-bit BLAKE2b over query and canonical variables; JSON never contains a raw NUL, so the separator is unambiguous
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(query.encode("utf-8"))
+        digest.update(b"\x00")
+        digest.update(self._serialize_variables(variables).encode("utf-8"))
+        return digest.hexdigest()
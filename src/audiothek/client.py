@@ -1,19 +1,59 @@
 """Audiothek API client for handling HTTP requests and GraphQL operations."""
 
+import concurrent.futures
+import contextlib
+import functools
+import itertools
 import json
 import logging
+import os
 import re
+import threading
 import time
-from typing import Any
+from collections.abc import Callable, Iterator
+from typing import Any, BinaryIO, TypeVar
 from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from .cache import GraphQLCache
+from .cache import CacheEntry, GraphQLCache
 from .exceptions import DownloadError, GraphQLError
 from .models import EpisodeMetadata, ResourceInfo
 from .utils import REQUEST_TIMEOUT, load_graphql_query
 
+# Connection pool sizing: the API and the media CDN are only a handful of hosts,
+# but up to 16 download workers may share the session concurrently.
+HTTP_POOL_CONNECTIONS = 8
+HTTP_POOL_MAXSIZE = 32
+HTTP_RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+USER_AGENT = "audiothek-downloader"
+
+# Audio files are streamed to disk in 1 MiB chunks instead of being held in memory.
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+# Bodies smaller than this are sniffed for textual error pages ("soft 404s").
+SOFT_404_MAX_BYTES = 1000
+SOFT_404_INDICATORS = (b"not found", b"error", b"deleted", b"removed", b"unavailable", b"404")
+_SOFT_404_RE = re.compile(b"|".join(map(re.escape, SOFT_404_INDICATORS)), re.IGNORECASE)
+# Audio responses with one of these content types are error pages; their body is never downloaded.
+SOFT_404_CONTENT_TYPES = ("text/", "application/json")
+HTTP_PARTIAL_CONTENT = 206
+# Downloads are written under this suffix and renamed into place once complete.
+PARTIAL_DOWNLOAD_SUFFIX = ".part"
+
+_URN_PREFIX = "urn:ard:"
+# Resource type by the URN segment following "urn:ard:"
+_URN_RESOURCE_TYPES = {"episode": "episode", "page": "collection", "show": "program"}
+_URN_PATH_RE = re.compile(r"/(urn:ard:[^/]+)/?$")
+_NUMERIC_PATH_RE = re.compile(r"/(\d+)/?$")
+
+PAGE_SIZE = 24  # API default page size
+# Pages known to exist are fetched concurrently, but bounded to stay polite to the API.
+PAGINATION_WORKERS = 4
+
+T = TypeVar("T")
+
 
 class AudiothekClient:
     """Client for ARD Audiothek API operations."""
@@ -32,15 +72,41 @@ class AudiothekClient:
 
         """
         self.logger = logging.getLogger(__name__)
-        self._session = requests.Session()
+        self._session = self._create_session()
         self._base_url = "https://api.ardaudiothek.de/graphql"
         self._cache = cache or GraphQLCache()
+        # GraphQL requests currently on the wire, so concurrent identical queries share one response
+        self._inflight: dict[tuple[str, str], concurrent.futures.Future[dict[str, Any]]] = {}
+        self._inflight_lock = threading.Lock()
 
         # Configure proxy if provided
         if proxy:
             proxies = {"http": proxy, "https": proxy}
             self._session.proxies = proxies
 
+    def close(self) -> None:
+        """Close the HTTP session and the database connections of the GraphQL cache."""
+        self._session.close()
+        self._cache.close()
+
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """Create a session with keep-alive connection pooling and transient-error retries."""
+        session = requests.Session()
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=HTTP_RETRY_STATUS_CODES,
+            # GraphQL queries are sent as POST but are read-only, so they are as safe to retry as GETs
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {"POST"},
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE, max_retries=retry)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update({"User-Agent": USER_AGENT})
+        return session
+
     @staticmethod
     def _is_incomplete_read_error(error: BaseException) -> bool:
         """Return True when an exception chain indicates an incomplete read."""
@@ -76,10 +142,48 @@ class AudiothekClient:
             self.logger.debug("Cache hit for %s", query_name or "unknown")
             return cached
 
+        inflight_key = (query, json.dumps(variables, sort_keys=True))
+        with self._inflight_lock:
+            future = self._inflight.get(inflight_key)
+            is_owner = future is None
+            if future is None:
+                future = concurrent.futures.Future()
+                self._inflight[inflight_key] = future
+        if not is_owner:
+            self.logger.debug("Waiting for in-flight %s request", query_name or "unknown")
+            return future.result()
+
         try:
-            response = self._session.get(
+            data = self._graphql_request(query, variables, query_name)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(data)
+            return data
+        finally:
+            with self._inflight_lock:
+                del self._inflight[inflight_key]
+
+    def _graphql_request(self, query: str, variables: dict[str, Any], query_name: str) -> dict[str, Any]:
+        """Send a GraphQL query to the API and cache the response.
+
+        Args:
+            query: GraphQL query string
+            variables: Variables for the query
+            query_name: Name of the query for error reporting
+
+        Returns:
+            JSON response as dictionary
+
+        Raises:
+            GraphQLError: If the query fails
+
+        """
+        try:
+            response = self._session.post(
                 self._base_url,
-                params={"query": query, "variables": json.dumps(variables)},
+                json={"query": query, "variables": variables},
                 timeout=REQUEST_TIMEOUT,
             )
             response.raise_for_status()
@@ -107,13 +211,18 @@ class AudiothekClient:
             DownloadError: If the download fails
 
         """
+        partial_path = file_path + PARTIAL_DOWNLOAD_SUFFIX
         try:
-            response = self._session.get(url, timeout=REQUEST_TIMEOUT)
-            if check_status:
-                response.raise_for_status()
-            with open(file_path, "wb") as f:
-                f.write(response.content)
+            response = self._session.get(url, stream=True, timeout=REQUEST_TIMEOUT)
+            try:
+                if check_status:
+                    response.raise_for_status()
+                self._stream_to_file(response, partial_path)
+            finally:
+                response.close()
+            os.replace(partial_path, file_path)
         except requests.RequestException as e:
+            self._discard_partial_file(partial_path)
             status_code = None
             if hasattr(e, "response") and e.response is not None and hasattr(e.response, "status_code"):
                 status_code = e.response.status_code
@@ -121,34 +230,157 @@ class AudiothekClient:
             self.logger.error(error_msg)
             raise DownloadError(url, status_code, error_msg) from e
         except OSError as e:
+            self._discard_partial_file(partial_path)
             error_msg = f"Failed to write to {file_path}: {str(e)}"
             self.logger.error(error_msg)
             raise DownloadError(url, None, error_msg) from e
 
-    def _fetch_and_validate_audio(self, url: str) -> bytes | None:
-        """Fetch audio content and validate it's not an error response.
+    @staticmethod
+    def _stream_to_file(response: requests.Response, file_path: str, *, append: bool = False) -> int:
+        """Write a streamed response body to file chunk by chunk.
+
+        Args:
+            response: Response opened with ``stream=True``
+            file_path: Path to save the body to
+            append: Whether to append to an existing partial file instead of truncating it
+
+        Returns:
+            Number of bytes written
+
+        """
+        written = 0
+        with open(file_path, "ab" if append else "wb", buffering=DOWNLOAD_CHUNK_SIZE) as f:
+            preallocated = not append and AudiothekClient._preallocate(f, response)
+            try:
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    if chunk:
+                        f.write(chunk)
+                        written += len(chunk)
+            finally:
+                if preallocated:
+                    # Drop any reserved space the body did not fill (short or broken transfer)
+                    f.truncate()
+        return written
+
+    @staticmethod
+    def _preallocate(f: BinaryIO, response: requests.Response) -> bool:
+        """Reserve disk space for a large body up front so the filesystem can allocate contiguous extents.
+
+        Args:
+            f: Freshly truncated file the body will be written to
+            response: Response whose ``Content-Length`` gives the expected size
+
+        Returns:
+            True if space was reserved and the file must be truncated to the written size afterwards
+
+        """
+        if not hasattr(os, "posix_fallocate"):
+            return False
+        try:
+            expected_length = int(response.headers.get("Content-Length") or 0)
+        except ValueError:
+            return False
+        if expected_length <= DOWNLOAD_CHUNK_SIZE:
+            return False
+        try:
+            os.posix_fallocate(f.fileno(), 0, expected_length)
+        except OSError:
+            # Not supported by every filesystem; streaming works the same without it
+            return False
+        return True
+
+    @staticmethod
+    def _discard_partial_file(partial_path: str) -> None:
+        """Remove an unfinished download, ignoring files that were never created."""
+        try:
+            os.remove(partial_path)
+        except FileNotFoundError:
+            pass
+
+    def _is_error_response_file(self, url: str, file_path: str, size: int) -> bool:
+        """Return True when a downloaded file is a small textual error response rather than audio."""
+        if size >= SOFT_404_MAX_BYTES:
+            return False
+
+        # One case-insensitive pass over the raw bytes; only the logged excerpt needs decoding
+        with open(file_path, "rb") as f:
+            content = f.read()
+        if _SOFT_404_RE.search(content):
+            if self.logger.isEnabledFor(logging.WARNING):
+                preview = content[:100].decode("utf-8", errors="ignore")
+                self.logger.warning("Audio file appears to be unavailable (error response): %s - Content: %s", url, preview)
+            return True
+        return False
+
+    def _fetch_and_validate_audio(self, url: str, file_path: str) -> bool:
+        """Stream audio content to file and validate it's not an error response.
 
         Args:
             url: The URL to fetch
+            file_path: The local file path to stream the audio to
 
         Returns:
-            The content bytes if valid audio, None if 404 or soft 404 (error text)
+            True if valid audio was written, False if 404 or soft 404 (error text)
+
+        Raises:
+            DownloadError: For HTTP errors other than 404
+
+        """
+        # The body goes to a .part file that only replaces file_path once complete and validated,
+        # so an interrupted run never leaves a truncated file under the final name.
+        partial_path = file_path + PARTIAL_DOWNLOAD_SUFFIX
+        completed = False
+        try:
+            completed = self._fetch_audio_to_partial_file(url, partial_path)
+            if completed:
+                os.replace(partial_path, file_path)
+            return completed
+        finally:
+            if not completed:
+                self._discard_partial_file(partial_path)
+
+    def _fetch_audio_to_partial_file(self, url: str, partial_path: str) -> bool:
+        """Stream audio content to a partial file, resuming broken transfers, and validate it.
+
+        Args:
+            url: The URL to fetch
+            partial_path: The temporary file path to stream the audio to
+
+        Returns:
+            True if valid audio was written, False if 404 or soft 404 (error text)
 
         Raises:
             DownloadError: For HTTP errors other than 404
 
         """
         max_attempts = 3
-        response = None
+        size = 0
         for attempt in range(1, max_attempts + 1):
             try:
-                response = self._session.get(url, timeout=REQUEST_TIMEOUT)
-                response.raise_for_status()
+                # After a broken transfer, ask for the missing tail only instead of starting over
+                resume_from = os.path.getsize(partial_path) if attempt > 1 and os.path.exists(partial_path) else 0
+                if resume_from:
+                    response = self._session.get(url, stream=True, timeout=REQUEST_TIMEOUT, headers={"Range": f"bytes={resume_from}-"})
+                else:
+                    response = self._session.get(url, stream=True, timeout=REQUEST_TIMEOUT)
+                try:
+                    response.raise_for_status()
+                    content_type = response.headers.get("Content-Type", "").lower()
+                    if content_type.startswith(SOFT_404_CONTENT_TYPES):
+                        self.logger.warning("Audio file appears to be unavailable (%s response): %s", content_type, url)
+                        return False
+                    if resume_from and response.status_code == HTTP_PARTIAL_CONTENT:
+                        self.logger.info("Resuming audio download at byte %s: %s", resume_from, url)
+                        size = resume_from + self._stream_to_file(response, partial_path, append=True)
+                    else:
+                        size = self._stream_to_file(response, partial_path)
+                finally:
+                    response.close()
                 break
             except requests.HTTPError as e:
                 if e.response.status_code == 404:
                     self.logger.warning("Audio file not found (404): %s", url)
-                    return None
+                    return False
                 self.logger.error("HTTP error downloading audio: %s - %s", url, e)
                 raise DownloadError(url, e.response.status_code, str(e)) from e
             except requests.RequestException as e:
@@ -166,18 +398,8 @@ class AudiothekClient:
                     continue
                 raise DownloadError(url, None, str(e)) from e
 
-        if response is None:
-            return None
-
         # Check if content is likely an error response rather than audio
-        content = response.content
-        if len(content) < 1000:  # Very small files are likely error responses
-            content_text = content.decode("utf-8", errors="ignore").lower()
-            if any(error_indicator in content_text for error_indicator in ["not found", "error", "deleted", "removed", "unavailable", "404"]):
-                self.logger.warning("Audio file appears to be unavailable (error response): %s - Content: %s", url, content_text[:100])
-                return None
-
-        return content
+        return not self._is_error_response_file(url, partial_path, size)
 
     def _download_audio_to_file(
         self,
@@ -203,42 +425,29 @@ class AudiothekClient:
             if candidate and candidate not in ordered_urls:
                 ordered_urls.append(candidate)
 
-        content: bytes | None = None
-        successful_url: str | None = None
-
         for index, candidate_url in enumerate(ordered_urls):
             if index > 0:
                 self.logger.info("Trying fallback URL: %s", candidate_url)
             try:
-                content = self._fetch_and_validate_audio(candidate_url)
-                if content is None:
+                if not self._fetch_and_validate_audio(candidate_url, file_path):
                     if index > 0:
                         self.logger.warning("Fallback URL also appears to be unavailable: %s", candidate_url)
                     continue
-                successful_url = candidate_url
-                break
+                if candidate_url != url:
+                    self.logger.info("Successfully downloaded from fallback URL: %s", candidate_url)
+                return True
             except DownloadError as e:
                 if index == len(ordered_urls) - 1:
                     self.logger.error("Error downloading audio from %s: %s", candidate_url, e)
                 else:
                     self.logger.error("Error downloading fallback audio: %s - %s", candidate_url, e)
+            except OSError as e:
+                self.logger.error("Failed to write audio file: %s - %s", file_path, e)
+                return False
             except Exception as e:
                 self.logger.error("Unexpected error downloading audio from %s: %s", candidate_url, e)
 
-        if content is None or successful_url is None:
-            return False
-
-        if successful_url != url:
-            self.logger.info("Successfully downloaded from fallback URL: %s", successful_url)
-
-        # Save the valid audio content
-        try:
-            with open(file_path, "wb") as f:
-                f.write(content)
-            return True
-        except OSError as e:
-            self.logger.error("Failed to write audio file: %s - %s", file_path, e)
-            return False
+        return False
 
     def _get_content_length(self, url: str) -> int | None:
         """Get content length from URL using HEAD request.
@@ -327,18 +536,20 @@ class AudiothekClient:
 
         # Extract audio URLs
         audio_urls = []
-        audios = node.get("audios") or []
-        for audio in audios:
+        for audio in node.get("audios") or []:
             if isinstance(audio, dict):
-                if audio.get("downloadUrl"):
-                    audio_urls.append(audio["downloadUrl"])
-                if audio.get("url"):
-                    audio_urls.append(audio["url"])
+                for key in ("downloadUrl", "url"):
+                    audio_url = audio.get(key)
+                    if audio_url:
+                        audio_urls.append(audio_url)
 
         # Extract image URLs
-        image = node.get("image") or {}
-        image_url = image.get("url", "").replace("{width}", "2000") if image.get("url") else ""
-        image_url_x1 = image.get("url1X1", "").replace("{width}", "2000") if image.get("url1X1") else ""
+        image_url = image_url_x1 = ""
+        image = node.get("image")
+        if image:
+            url_template, url_x1_template = image.get("url"), image.get("url1X1")
+            image_url = url_template.replace("{width}", "2000") if url_template else ""
+            image_url_x1 = url_x1_template.replace("{width}", "2000") if url_x1_template else ""
 
         return EpisodeMetadata(
             id=str(node.get("id", "")),
@@ -366,8 +577,11 @@ class AudiothekClient:
 
         """
         try:
-            metadata = self.get_episode_metadata(episode_id)
-            return metadata.program_set_title if metadata else None
+            # Only the program set title is needed, so skip the full EpisodeQuery payload
+            query = load_graphql_query("EpisodeTitleQuery.graphql")
+            response_json = self._graphql_get(query, {"id": episode_id}, "EpisodeTitleQuery")
+            node = response_json.get("data", {}).get("result") or {}
+            return (node.get("programSet") or {}).get("title")
         except Exception as e:
             self.logger.error("Error getting episode title: %s", e)
             return None
@@ -423,6 +637,25 @@ class AudiothekClient:
             self.logger.error("Error getting program set title: %s", e)
             return None
 
+    def get_collection_title(self, collection_id: str) -> str | None:
+        """Get editorial collection title without fetching any of its items.
+
+        Args:
+            collection_id: Editorial collection ID
+
+        Returns:
+            Collection title, or None if not found
+
+        """
+        try:
+            query = load_graphql_query("CollectionTitleQuery.graphql")
+            response_json = self._graphql_get(query, {"id": collection_id}, "CollectionTitleQuery")
+            result = response_json.get("data", {}).get("result") or {}
+            return result.get("title")
+        except Exception as e:
+            self.logger.error("Error getting collection title: %s", e)
+            return None
+
     def get_title(self, resource_id: str, resource_type: str) -> str | None:
         """Get title for a resource based on its type.
 
@@ -436,11 +669,14 @@ class AudiothekClient:
         """
         if resource_type == "episode":
             return self.get_episode_title(resource_id)
-        elif resource_type in ["program", "collection"]:
+        elif resource_type == "program":
             return self.get_program_set_title(resource_id)
+        elif resource_type == "collection":
+            return self.get_collection_title(resource_id)
         return None
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def determine_resource_type_from_id(resource_id: str) -> ResourceInfo | None:
         """Determine resource type from ID pattern.
 
@@ -451,24 +687,20 @@ class AudiothekClient:
             ResourceInfo object with resource type and ID, or None if not recognized
 
         """
-        if resource_id.startswith("urn:ard:episode:"):
-            return ResourceInfo("episode", resource_id)
-        if resource_id.startswith("urn:ard:page:"):
-            return ResourceInfo("collection", resource_id)
-        if resource_id.startswith("urn:ard:show:"):
-            return ResourceInfo("program", resource_id)
-        # fallback: treat other urns as program sets
-        if resource_id.startswith("urn:ard:"):
-            return ResourceInfo("program", resource_id)
+        if resource_id.startswith(_URN_PREFIX):
+            kind, separator, _ = resource_id[len(_URN_PREFIX) :].partition(":")
+            # fallback: treat other urns as program sets
+            return ResourceInfo(_URN_RESOURCE_TYPES.get(kind, "program") if separator else "program", resource_id)
         # numeric IDs are typically programs
         if resource_id.isdigit():
             return ResourceInfo("program", resource_id)
         # alphanumeric IDs (like "ps1") are also treated as programs
-        if re.match(r"^[a-zA-Z0-9]+$", resource_id):
+        if resource_id.isascii() and resource_id.isalnum():
             return ResourceInfo("program", resource_id)
         return None
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def parse_url(url: str) -> ResourceInfo | None:
         """Parse Audiothek URL and return resource info.
 
@@ -488,19 +720,112 @@ class AudiothekClient:
             return None
 
         # Extract URN or numeric ID
-        urn_match = re.search(r"/(urn:ard:[^/]+)/?$", url)
+        urn_match = _URN_PATH_RE.search(url)
         if urn_match:
             resource_id = urn_match.group(1)
             resource_info = AudiothekClient.determine_resource_type_from_id(resource_id)
             return resource_info
 
-        numeric_match = re.search(r"/(\d+)/?$", url)
+        numeric_match = _NUMERIC_PATH_RE.search(url)
         if numeric_match:
             resource_id = numeric_match.group(1)
             return ResourceInfo("program", resource_id)
 
         return None
 
+    def _fetch_items_page(self, query: str, resource_id: str, offset: int, count: int, query_name: str) -> tuple[dict[str, Any], list[dict[str, Any]], bool]:
+        """Fetch a single page of a ``result.items`` connection.
+
+        Args:
+            query: GraphQL query string
+            resource_id: ID of the program set or collection
+            offset: Pagination offset
+            count: Number of items to return
+            query_name: Name of the query for error reporting
+
+        Returns:
+            Tuple of (result dict, page nodes, has next page)
+
+        """
+        variables = {"id": resource_id, "offset": offset, "count": count}
+        response_json = self._graphql_get(query, variables, query_name)
+
+        result = response_json.get("data", {}).get("result", {}) or {}
+        items = result.get("items", {}) or {}
+        page_nodes = items.get("nodes", []) or []
+        page_info = items.get("pageInfo", {}) or {}
+        return result, page_nodes, bool(page_info.get("hasNextPage"))
+
+    def _fetch_paginated_items(
+        self,
+        query: str,
+        resource_id: str,
+        query_name: str,
+        limit: int,
+    ) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+        """Fetch all nodes of a paginated ``result.items`` connection.
+
+        The first page is fetched on its own. When it reports more pages, the
+        remaining pages implied by the connection's ``totalCount`` (falling back to
+        ``numberOfElements``) are requested concurrently and merged in offset order;
+        anything beyond that estimate is fetched sequentially.
+
+        Args:
+            query: GraphQL query string
+            resource_id: ID of the program set or collection
+            query_name: Name of the query for error reporting
+            limit: Maximum number of nodes to fetch
+
+        Returns:
+            Tuple of (nodes list, result dict of the first page)
+
+        Raises:
+            GraphQLError: If a query fails
+
+        """
+        if limit <= 0:
+            return [], {}
+
+        # Page responses are written to the cache in one transaction once the traversal ends
+        with self._cache.batch() as pending_writes:
+            first_result, nodes, has_next_page = self._fetch_items_page(query, resource_id, 0, min(PAGE_SIZE, limit), query_name)
+            offset = PAGE_SIZE
+
+            # totalCount counts the filtered connection itself; numberOfElements is the unfiltered program size
+            total_count = (first_result.get("items") or {}).get("totalCount")
+            if total_count is None:
+                total_count = first_result.get("numberOfElements")
+            total = min(int(total_count or 0), limit)
+            prefetch_offsets = list(range(offset, total, PAGE_SIZE)) if has_next_page and nodes else []
+            if prefetch_offsets:
+                with concurrent.futures.ThreadPoolExecutor(max_workers=PAGINATION_WORKERS) as executor:
+                    pages = list(
+                        executor.map(
+                            lambda page_offset: self._in_cache_batch(
+                                pending_writes, self._fetch_items_page, query, resource_id, page_offset, min(PAGE_SIZE, limit - page_offset), query_name
+                            ),
+                            prefetch_offsets,
+                        )
+                    )
+                for result, page_nodes, page_has_next in pages:
+                    if not result or not page_nodes:
+                        has_next_page = False
+                        break
+                    nodes.extend(page_nodes)
+                    offset += PAGE_SIZE
+                    has_next_page = page_has_next
+                    if not has_next_page:
+                        break
+
+            while has_next_page and nodes and offset < limit:
+                result, page_nodes, has_next_page = self._fetch_items_page(query, resource_id, offset, min(PAGE_SIZE, limit - offset), query_name)
+                if not result or not page_nodes:
+                    break
+                nodes.extend(page_nodes)
+                offset += PAGE_SIZE
+
+            return nodes[:limit], first_result
+
     def fetch_program_set_episodes(self, program_id: str, limit: int = 1000) -> list[dict[str, Any]]:
         """Fetch all episodes for a program set using pagination.
 
@@ -515,39 +840,31 @@ class AudiothekClient:
             GraphQLError: If the query fails
 
         """
-        query = load_graphql_query("ProgramSetEpisodesQuery.graphql")
-
-        nodes: list[dict[str, Any]] = []
-        offset = 0
-        count = 24  # API default page size
-
-        while True:
-            remaining = max(0, limit - len(nodes))
-            if remaining == 0:
-                break
-
-            variables = {"id": program_id, "offset": offset, "count": min(count, remaining)}
-            response_json = self._graphql_get(query, variables, "ProgramSetEpisodesQuery")
-
-            result = response_json.get("data", {}).get("result", {})
-            if not result:
-                break
+        nodes, _ = self.fetch_program_set(program_id, limit)
+        return nodes
 
-            items = result.get("items", {}) or {}
-            page_nodes = items.get("nodes", []) or []
+    def fetch_program_set(
+        self,
+        program_id: str,
+        limit: int = 1000,
+    ) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+        """Fetch all episodes of a program set together with the program set data.
 
-            if not page_nodes:
-                break
+        The program set fields come from the first page, so no separate request is needed for them.
 
-            nodes.extend(page_nodes)
+        Args:
+            program_id: Program set ID
+            limit: Maximum number of episodes to fetch
 
-            page_info = items.get("pageInfo", {}) or {}
-            if not page_info.get("hasNextPage"):
-                break
+        Returns:
+            Tuple of (nodes list, program set data dict)
 
-            offset += count
+        Raises:
+            GraphQLError: If the query fails
 
-        return nodes
+        """
+        query = load_graphql_query("ProgramSetEpisodesQuery.graphql")
+        return self._fetch_paginated_items(query, program_id, "ProgramSetEpisodesQuery", limit)
 
     def fetch_editorial_collection(self, collection_id: str, limit: int = 1000) -> tuple[list[dict[str, Any]], dict[str, Any]]:
         """Fetch all nodes for an editorial collection using pagination.
@@ -564,43 +881,55 @@ class AudiothekClient:
 
         """
         query = load_graphql_query("editorialCollection.graphql")
+        return self._fetch_paginated_items(query, collection_id, "editorialCollection", limit)
 
-        nodes: list[dict[str, Any]] = []
-        collection_data: dict[str, Any] | None = None
-        offset = 0
-        count = 24  # API default page size
-
-        while True:
-            remaining = max(0, limit - len(nodes))
-            if remaining == 0:
-                break
+    def _in_cache_batch(self, pending_writes: list[CacheEntry], func: Callable[..., T], *args: object) -> T:
+        """Run ``func`` on a worker thread as part of the cache batch opened by the submitting thread."""
+        with self._cache.batch(pending_writes):
+            return func(*args)
 
-            variables = {"id": collection_id, "offset": offset, "count": min(count, remaining)}
-            response_json = self._graphql_get(query, variables, "editorialCollection")
+    def _iter_result_pages(self, query: str, variables: dict[str, Any], query_name: str, remaining: Callable[[], int]) -> Iterator[dict[str, Any]]:
+        """Yield the ``result`` of consecutive offset-paginated pages in order.
 
-            results = response_json.get("data", {}).get("result", {})
-            if not results:
-                break
+        Pages are requested speculatively in windows of up to ``PAGINATION_WORKERS``
+        concurrent queries. Before each window ``remaining`` is read again, and every
+        page asks for ``min(PAGE_SIZE, remaining)`` items assuming the pages before it
+        in the window come back full, so no window requests more than the caller still
+        needs. The caller stops iterating once it has seen the last page or collected
+        enough items; pages fetched beyond that are discarded.
 
-            # Store collection data on first iteration
-            if collection_data is None:
-                collection_data = results
-
-            items = results.get("items", {}) or {}
-            page_nodes = items.get("nodes", []) or []
-
-            if not page_nodes:
-                break
-
-            nodes.extend(page_nodes)
+        Args:
+            query: GraphQL query string
+            variables: Query variables without ``offset``/``count``
+            query_name: Name of the query for error reporting
+            remaining: Returns how many more items the caller wants
 
-            page_info = items.get("pageInfo", {}) or {}
-            if not page_info.get("hasNextPage"):
-                break
+        Yields:
+            The ``data.result`` dict of each page
 
-            offset += count
+        Raises:
+            GraphQLError: If a query fails
 
-        return nodes, collection_data or {}
+        """
+        offset = 0
+        # Page responses are written to the cache in one transaction once the caller stops iterating
+        with self._cache.batch() as pending_writes, concurrent.futures.ThreadPoolExecutor(max_workers=PAGINATION_WORKERS) as executor:
+            while (items_left := remaining()) > 0:
+                counts = [min(PAGE_SIZE, items_left - start) for start in range(0, min(items_left, PAGINATION_WORKERS * PAGE_SIZE), PAGE_SIZE)]
+                futures = [
+                    executor.submit(
+                        self._in_cache_batch,
+                        pending_writes,
+                        self._graphql_get,
+                        query,
+                        {**variables, "offset": offset + index * PAGE_SIZE, "count": count},
+                        query_name,
+                    )
+                    for index, count in enumerate(counts)
+                ]
+                offset += len(counts) * PAGE_SIZE
+                for future in futures:
+                    yield future.result().get("data", {}).get("result") or {}
 
     def find_program_sets_by_editorial_category_id(self, editorial_category_id: str, limit: int = 200) -> list[dict[str, Any]]:
         """Find program sets by editorial category ID.
@@ -619,32 +948,24 @@ class AudiothekClient:
         query = load_graphql_query("ProgramSetsByEditorialCategoryId.graphql")
 
         nodes: list[dict[str, Any]] = []
-        offset = 0
-        count = 24  # API default page size
-
-        while True:
-            remaining = max(0, limit - len(nodes))
-            if remaining == 0:
-                break
-
-            variables = {"editorialCategoryId": editorial_category_id, "offset": offset, "count": min(count, remaining)}
-            response_json = self._graphql_get(query, variables, "ProgramSetsByEditorialCategoryId")
-
-            result = response_json.get("data", {}).get("result") or {}
-            page_nodes = result.get("nodes") or []
-
-            if not page_nodes:
-                break
+        if limit <= 0:
+            return nodes
 
-            nodes.extend(page_nodes)
+        pages = self._iter_result_pages(query, {"editorialCategoryId": editorial_category_id}, "ProgramSetsByEditorialCategoryId", lambda: limit - len(nodes))
+        # Closing the generator on an early break joins its pool and writes its cache batch right away
+        with contextlib.closing(pages):
+            for result in pages:
+                page_nodes = result.get("nodes") or []
+                if not page_nodes:
+                    break
 
-            page_info = result.get("pageInfo") or {}
-            if not page_info.get("hasNextPage"):
-                break
+                nodes.extend(page_nodes)
 
-            offset += count
+                page_info = result.get("pageInfo") or {}
+                if len(nodes) >= limit or not page_info.get("hasNextPage"):
+                    break
 
-        return nodes
+        return nodes[:limit]
 
     def find_editorial_collections_by_editorial_category_id(self, editorial_category_id: str, limit: int = 200) -> list[dict[str, Any]]:
         """Find editorial collections by editorial category ID.
@@ -663,41 +984,26 @@ class AudiothekClient:
         query = load_graphql_query("EditorialCategoryCollections.graphql")
 
         collections_by_id: dict[str, dict[str, Any]] = {}
-        offset = 0
-        count = 24  # API default page size
+        if limit <= 0:
+            return []
 
-        while True:
-            remaining = max(0, limit - len(collections_by_id))
-            if remaining == 0:
-                break
-
-            before_count = len(collections_by_id)
-
-            variables = {"id": editorial_category_id, "offset": offset, "count": min(count, remaining)}
-            response_json = self._graphql_get(query, variables, "EditorialCategoryCollections")
+        pages = self._iter_result_pages(query, {"id": editorial_category_id}, "EditorialCategoryCollections", lambda: limit - len(collections_by_id))
+        with contextlib.closing(pages):
+            for result in pages:
+                sections = result.get("sections") or []
+                if not sections:
+                    break
 
-            result = response_json.get("data", {}).get("result") or {}
-            sections = result.get("sections") or []
-
-            if not sections:
-                break
+                before_count = len(collections_by_id)
 
-            for section in sections:
-                section_nodes = (section or {}).get("nodes") or []
-                if not section_nodes:
-                    continue
-
-                for node in section_nodes:
+                # The first occurrence of a collection wins; repeats in later sections or pages are skipped
+                for node in itertools.chain.from_iterable((section or {}).get("nodes") or [] for section in sections):
                     node_id = (node or {}).get("id")
-                    if not node_id:
-                        continue
-
-                    collections_by_id[str(node_id)] = node
-
-            # If no new collections were found, we're done
-            if len(collections_by_id) == before_count:
-                break
+                    if node_id:
+                        collections_by_id.setdefault(str(node_id), node)
 
-            offset += count
+                # If no new collections were found, we're done
+                if len(collections_by_id) == before_count or len(collections_by_id) >= limit:
+                    break
 
-        return list(collections_by_id.values())
+        return list(collections_by_id.values())[:limit]
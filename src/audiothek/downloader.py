@@ -1,14 +1,19 @@
 """ARD Audiothek downloader class."""
 
+import concurrent.futures
 import logging
 import os
 import re
+import shutil
 from collections.abc import Iterator
 from contextlib import contextmanager
 from typing import Any
 
 from filelock import FileLock, Timeout
 from mutagen._file import File
+from mutagen.aac import AAC
+from mutagen.mp3 import MP3
+from mutagen.mp4 import MP4
 
 from .cache import GraphQLCache
 from .client import AudiothekClient
@@ -22,9 +27,45 @@ from .file_utils import (
     set_file_modification_time,
 )
 from .models import DownloadResult, ImageMetadata
-from .parallel import parallel_download_nodes
+from .parallel import parallel_download_nodes, parallel_process
 from .utils import sanitize_folder_name
 
+_TITLE_WORD_RE = re.compile(r"\w+")
+_FOLDER_ID_PREFIX_RE = re.compile(r"^(\d+)")
+
+AUDIO_FILE_EXTENSIONS = (".mp3", ".mp4", ".aac", ".m4a")
+# Known containers skip mutagen's format sniffing; anything else falls back to File()
+_AUDIO_LOADERS = {".mp3": MP3, ".mp4": MP4, ".m4a": MP4, ".aac": AAC}
+
+# Fields copied into the saved collection/program set metadata, in output order
+_COLLECTION_DATA_KEYS = (
+    "id",
+    "coreId",
+    "title",
+    "synopsis",
+    "summary",
+    "editorialDescription",
+    "image",
+    "sharingUrl",
+    "path",
+    "numberOfElements",
+    "broadcastDuration",
+)
+_PROGRAM_SET_DATA_KEYS = (
+    "id",
+    "coreId",
+    "title",
+    "synopsis",
+    "numberOfElements",
+    "image",
+    "editorialCategoryId",
+    "imageCollectionId",
+    "publicationServiceId",
+    "coreDocument",
+    "rowId",
+    "nodeId",
+)
+
 
 class AudiothekDownloader:
     """ARD Audiothek downloader class."""
@@ -53,6 +94,12 @@ class AudiothekDownloader:
         self.client = AudiothekClient(proxy=proxy, cache=cache)
         self.max_workers = max(1, min(max_workers, 16))  # Limit between 1 and 16 workers
         self.file_lock_timeout = max(1.0, float(file_lock_timeout))
+        # Image URL -> first local file it was saved to, so shared cover art is fetched once per session
+        self._image_paths_by_url: dict[str, str] = {}
+
+    def close(self) -> None:
+        """Release the client's HTTP connections and cache database connections."""
+        self.client.close()
 
     @staticmethod
     def _program_folder_name(programset_id: str, programset_title: str) -> str:
@@ -87,11 +134,12 @@ class AudiothekDownloader:
             self.logger.error(error_msg)
             raise FileOperationError(file_path, operation, error_msg) from exc
         finally:
-            if os.path.exists(lock_path):
-                try:
-                    os.remove(lock_path)
-                except OSError:
-                    self.logger.debug("Failed to remove lock file %s", lock_path)
+            try:
+                os.remove(lock_path)
+            except FileNotFoundError:
+                pass
+            except OSError:
+                self.logger.debug("Failed to remove lock file %s", lock_path)
 
     def download_from_url(self, url: str, folder: str | None = None) -> DownloadResult:
         """Download content from an ARD Audiothek URL.
@@ -135,11 +183,23 @@ class AudiothekDownloader:
             self.logger.error(error_msg)
             return DownloadResult(success=False, message=error_msg)
 
-        resource_type, parsed_id = resource.resource_type, resource.resource_id
+        return self._dispatch(resource.resource_type, resource.resource_id, target_folder)
+
+    def _dispatch(self, resource_type: str, resource_id: str, folder: str) -> DownloadResult:
+        """Download an already classified resource.
+
+        Args:
+            resource_type: Type of resource ("episode", "program" or "collection")
+            resource_id: The parsed resource ID
+            folder: The output directory
+
+        Returns:
+            DownloadResult with success status and message
+
+        """
         if resource_type == "episode":
-            return self._download_single_episode(parsed_id, target_folder)
-        else:
-            return self._download_collection(parsed_id, target_folder, resource_type == "collection")
+            return self._download_single_episode(resource_id, folder)
+        return self._download_collection(resource_id, folder, resource_type == "collection")
 
     def update_all_folders(self, folder: str | None = None) -> DownloadResult:
         """Update all subfolders in the output directory by crawling through existing IDs.
@@ -163,28 +223,26 @@ class AudiothekDownloader:
 
         # Find all subdirectories that end with numeric IDs
         try:
-            for item in os.listdir(target_folder):
-                item_path = os.path.join(target_folder, item)
-                if os.path.isdir(item_path):
-                    # Check if the folder name ends with a numeric ID
-                    if item.isdigit():
-                        self.logger.info("Processing folder: %s", item)
-                        result = self.download_from_id(item, target_folder)
-                        if result.success:
-                            updated_count += 1
-                        else:
-                            error_count += 1
-                    else:
-                        # Try to extract numeric ID from the folder name
-                        match = re.search(r"^(\d+)", item)
-                        if match:
-                            numeric_id = match.group(1)
-                            self.logger.info("Processing folder: %s (ID: %s)", item, numeric_id)
-                            result = self.download_from_id(numeric_id, target_folder)
-                            if result.success:
-                                updated_count += 1
-                            else:
-                                error_count += 1
+            # Snapshot the listing first: downloads below may add folders to target_folder
+            with os.scandir(target_folder) as entries:
+                folder_names = [entry.name for entry in entries if entry.is_dir()]
+            for item in folder_names:
+                # Check if the folder name is or starts with a numeric ID
+                if item.isdigit():
+                    numeric_id = item
+                    self.logger.info("Processing folder: %s", item)
+                else:
+                    match = _FOLDER_ID_PREFIX_RE.match(item)
+                    if not match:
+                        continue
+                    numeric_id = match.group(1)
+                    self.logger.info("Processing folder: %s (ID: %s)", item, numeric_id)
+                # Program folders are always named after a numeric program set ID, so skip re-classifying it
+                result = self._dispatch("program", numeric_id, target_folder)
+                if result.success:
+                    updated_count += 1
+                else:
+                    error_count += 1
         except Exception as e:
             error_msg = f"Error while updating folders: {e}"
             self.logger.error(error_msg)
@@ -222,12 +280,21 @@ class AudiothekDownloader:
 
         # Find all subdirectories
         try:
-            for item in os.listdir(target_folder):
-                item_path = os.path.join(target_folder, item)
-                if os.path.isdir(item_path):
-                    result = self._process_folder_quality(item_path, dry_run)
-                    removed_count += result.get("removed", 0)
-                    error_count += result.get("errors", 0)
+            with os.scandir(target_folder) as entries:
+                folder_paths = [entry.path for entry in entries if entry.is_dir()]
+            # Bitrate probing is blocking header I/O per file, so overlap it across program folders
+            folder_results = parallel_process(
+                folder_paths,
+                lambda item_path, _index, _total: self._process_folder_quality(item_path, dry_run),
+                max_workers=self.max_workers,
+                logger=self.logger,
+            )
+            for success, result, _exception in folder_results:
+                if not success or result is None:
+                    error_count += 1
+                    continue
+                removed_count += result.get("removed", 0)
+                error_count += result.get("errors", 0)
         except Exception as e:
             error_msg = f"Error while processing folders: {e}"
             self.logger.error(error_msg)
@@ -256,16 +323,16 @@ class AudiothekDownloader:
         try:
             # Group files by base name (without extension)
             file_groups: dict[str, dict[str, str]] = {}
-            for file in os.listdir(folder_path):
-                file_path = os.path.join(folder_path, file)
-                if os.path.isfile(file_path):
-                    base_name, ext = os.path.splitext(file)
-                    ext = ext.lower()
+            with os.scandir(folder_path) as entries:
+                folder_files = [(entry.name, entry.path) for entry in entries if entry.is_file()]
+            for file, file_path in folder_files:
+                base_name, ext = os.path.splitext(file)
+                ext = ext.lower()
 
-                    if ext in [".mp3", ".mp4", ".aac", ".m4a"]:
-                        if base_name not in file_groups:
-                            file_groups[base_name] = {}
-                        file_groups[base_name][ext] = file_path
+                if ext in AUDIO_FILE_EXTENSIONS:
+                    if base_name not in file_groups:
+                        file_groups[base_name] = {}
+                    file_groups[base_name][ext] = file_path
 
             # Process each group of files
             for base_name, files in file_groups.items():
@@ -372,15 +439,10 @@ class AudiothekDownloader:
 
         """
         try:
-            audio = File(file_path)
+            loader = _AUDIO_LOADERS.get(os.path.splitext(file_path)[1].lower(), File)
+            audio = loader(file_path)
             if audio is not None:
-                bitrate_value: int | None = None
-                if hasattr(audio.info, "bitrate"):
-                    bitrate_value = audio.info.bitrate
-                # For some formats, bitrate might be in different location
-                elif hasattr(audio, "info") and hasattr(audio.info, "bitrate"):
-                    bitrate_value = audio.info.bitrate
-
+                bitrate_value: int | None = getattr(audio.info, "bitrate", None)
                 if bitrate_value is None:
                     return None
 
@@ -420,37 +482,12 @@ class AudiothekDownloader:
     @staticmethod
     def _extract_collection_data(results: dict[str, Any]) -> dict[str, Any]:
         """Extract collection data from GraphQL results."""
-        return {
-            "id": results.get("id"),
-            "coreId": results.get("coreId"),
-            "title": results.get("title"),
-            "synopsis": results.get("synopsis"),
-            "summary": results.get("summary"),
-            "editorialDescription": results.get("editorialDescription"),
-            "image": results.get("image"),
-            "sharingUrl": results.get("sharingUrl"),
-            "path": results.get("path"),
-            "numberOfElements": results.get("numberOfElements"),
-            "broadcastDuration": results.get("broadcastDuration"),
-        }
+        return {key: results.get(key) for key in _COLLECTION_DATA_KEYS}
 
     @staticmethod
     def _extract_program_set_data(results: dict[str, Any]) -> dict[str, Any]:
         """Extract program set data from GraphQL results."""
-        return {
-            "id": results.get("id"),
-            "coreId": results.get("coreId"),
-            "title": results.get("title"),
-            "synopsis": results.get("synopsis"),
-            "numberOfElements": results.get("numberOfElements"),
-            "image": results.get("image"),
-            "editorialCategoryId": results.get("editorialCategoryId"),
-            "imageCollectionId": results.get("imageCollectionId"),
-            "publicationServiceId": results.get("publicationServiceId"),
-            "coreDocument": results.get("coreDocument"),
-            "rowId": results.get("rowId"),
-            "nodeId": results.get("nodeId"),
-        }
+        return {key: results.get(key) for key in _PROGRAM_SET_DATA_KEYS}
 
     def _download_collection(self, resource_id: str, folder: str, is_editorial_collection: bool) -> DownloadResult:
         """Download episodes from ARD Audiothek.
@@ -468,8 +505,12 @@ class AudiothekDownloader:
             if is_editorial_collection:
                 nodes, raw_collection_data = self.client.fetch_editorial_collection(resource_id)
             else:
-                nodes = self.client.fetch_program_set_episodes(resource_id)
-                raw_collection_data = self.client.get_program_set_data(resource_id) or {}
+                # Repeated runs within the cache TTL get every page from the GraphQL response cache
+                nodes, raw_collection_data = self.client.fetch_program_set(resource_id)
+                if nodes and self._is_program_folder_complete(nodes, folder):
+                    self.logger.info("Program %s is already complete on disk, skipping episode downloads", resource_id)
+                    self._save_collection_metadata(raw_collection_data, nodes, folder, is_editorial_collection)
+                    return DownloadResult(success=True, message=f"Program {resource_id} is up to date")
 
             if not nodes:
                 return DownloadResult(success=True, message=f"No episodes found for {'collection' if is_editorial_collection else 'program'} {resource_id}")
@@ -485,6 +526,39 @@ class AudiothekDownloader:
             self.logger.exception(e)
             return DownloadResult(success=False, message=error_msg, error=e)
 
+    def _is_program_folder_complete(self, nodes: list[dict[str, Any]], folder: str) -> bool:
+        """Check whether a program folder already holds every published episode.
+
+        Every published episode is looked up by file name: counts alone would treat a folder
+        as complete when a saved episode was depublished while another one is still missing.
+        Local episodes that are no longer published don't matter.
+
+        Args:
+            nodes: All published episode nodes of the program
+            folder: Base folder for downloads
+
+        Returns:
+            True if every episode has a local audio file
+
+        """
+        if not nodes:
+            return False
+
+        program_path = self._program_path_for_node(nodes[0], folder)
+        try:
+            with os.scandir(program_path) as entries:
+                local_episodes = {
+                    os.path.splitext(entry.name)[0] for entry in entries if entry.name.lower().endswith(AUDIO_FILE_EXTENSIONS) and entry.is_file()
+                }
+        except OSError:
+            return False
+
+        for index, node in enumerate(nodes):
+            node_id = str(node.get("id") or index)
+            if self._episode_filename(node_id, node.get("title") or node_id) not in local_episodes:
+                return False
+        return True
+
     def _save_collection_metadata(self, raw_data: dict[str, Any], nodes: list[dict], folder: str, is_editorial_collection: bool) -> None:
         """Save collection metadata and cover image."""
         collection_data = self._extract_collection_data(raw_data) if is_editorial_collection else self._extract_program_set_data(raw_data)
@@ -570,32 +644,72 @@ class AudiothekDownloader:
         if not nodes:
             return DownloadResult(success=True, message="No episodes to download")
 
-        # Use parallel download if more than one node and max_workers > 1
-        if len(nodes) > 1 and self.max_workers > 1:
-            self.logger.debug("Using parallel download with %d workers for %d episodes", self.max_workers, len(nodes))
-            return parallel_download_nodes(
-                nodes, lambda node, index, total: self._process_single_node(node, folder, index, total), self.max_workers, self.logger
-            )
+        # List every program folder once up front so already downloaded assets can
+        # be skipped without a stat call (and lock file) per asset.
+        program_paths = [self._program_path_for_node(node, folder) for node in nodes]
+        existing_files_by_path = {path: self._scan_existing_files(path) for path in set(program_paths)}
 
-        # Otherwise use sequential download
-        success_count = 0
-        error_count = 0
+        # One cover image pool for the whole batch, sized like the episode workers, so episode and
+        # image connections together stay within the client's HTTP pool (2 x 16 = HTTP_POOL_MAXSIZE)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="audiothek-image") as image_executor:
 
-        for index, node in enumerate(nodes):
-            try:
-                if self._process_single_node(node, folder, index, len(nodes)):
-                    success_count += 1
-                else:
+            def process(node: dict[str, Any], index: int, total: int) -> bool:
+                program_path = program_paths[index]
+                return self._process_single_node(node, folder, index, total, existing_files_by_path[program_path], program_path, image_executor=image_executor)
+
+            # Use parallel download if more than one node and max_workers > 1
+            if len(nodes) > 1 and self.max_workers > 1:
+                self.logger.debug("Using parallel download with %d workers for %d episodes", self.max_workers, len(nodes))
+                return parallel_download_nodes(nodes, process, self.max_workers, self.logger)
+
+            # Otherwise use sequential download
+            success_count = 0
+            error_count = 0
+
+            for index, node in enumerate(nodes):
+                try:
+                    if process(node, index, len(nodes)):
+                        success_count += 1
+                    else:
+                        error_count += 1
+                except Exception as e:
+                    self.logger.error("Error processing node: %s", e)
                     error_count += 1
-            except Exception as e:
-                self.logger.error("Error processing node: %s", e)
-                error_count += 1
 
         if error_count > 0:
             return DownloadResult(success=success_count > 0, message=f"Downloaded {success_count} episodes with {error_count} errors")
         return DownloadResult(success=True, message=f"Successfully downloaded {success_count} episodes")
 
-    def _process_single_node(self, node: dict[str, Any], folder: str, index: int, total_count: int) -> bool:
+    @staticmethod
+    def _program_path_for_node(node: dict[str, Any], folder: str) -> str:
+        """Return the program folder path a node's assets are saved to."""
+        program_set = node.get("programSet") or {}
+        programset_id = program_set.get("id") or "episode"
+        programset_title = program_set.get("title") or ""
+
+        # Create folder name with ID and title: "123456 Show Title"
+        folder_name = AudiothekDownloader._program_folder_name(str(programset_id), str(programset_title))
+        return os.path.join(folder, folder_name)
+
+    def _scan_existing_files(self, program_path: str) -> frozenset[str]:
+        """Return the names of all entries in a program folder, or an empty set if it doesn't exist."""
+        try:
+            with os.scandir(program_path) as entries:
+                return frozenset(entry.name for entry in entries)
+        except OSError:
+            return frozenset()
+
+    def _process_single_node(
+        self,
+        node: dict[str, Any],
+        folder: str,
+        index: int,
+        total_count: int,
+        existing_files: frozenset[str] = frozenset(),
+        program_path: str | None = None,
+        *,
+        image_executor: concurrent.futures.Executor | None = None,
+    ) -> bool:
         """Process a single node for download.
 
         Args:
@@ -603,6 +717,9 @@ class AudiothekDownloader:
             folder: Base folder for downloads
             index: Current node index
             total_count: Total number of nodes
+            existing_files: Names of files already present in the program folder
+            program_path: Precomputed program folder for the node, derived from it when omitted
+            image_executor: Shared pool for fetching the node's second cover image alongside the first
 
         Returns:
             True if successful, False otherwise
@@ -611,27 +728,18 @@ class AudiothekDownloader:
         try:
             node_id = str(node.get("id") or index)
             title = node.get("title") or node_id
-
-            # get title from infos
-            array_filename = re.findall(r"(\w+)", title)
-            filename_base = "_".join(array_filename) if array_filename else node_id
-            filename = f"{filename_base}_{node_id}"
+            filename = self._episode_filename(node_id, title)
 
             # Extract URLs from node
             image_urls = self._extract_image_urls(node)
-            audio_urls = self._extract_audio_url(node)
+            audio_urls, probed_sizes = self._extract_audio_urls_with_sizes(node)
             if not audio_urls:
                 self.logger.warning("No audio URL found for node %s", node_id)
                 return False
 
             # Get program information
             program_set = node.get("programSet") or {}
-            programset_id = program_set.get("id") or "episode"
-            programset_title = program_set.get("title") or ""
-
-            # Create folder name with ID and title: "123456 Show Title"
-            folder_name = AudiothekDownloader._program_folder_name(str(programset_id), str(programset_title))
-            program_path: str = os.path.join(folder, folder_name)
+            program_path = program_path or self._program_path_for_node(node, folder)
 
             # Create directory
             if not ensure_directory_exists(program_path, self.logger):
@@ -646,17 +754,28 @@ class AudiothekDownloader:
                     program_path=program_path,
                     program_set=program_set,
                     image_urls=image_urls,
+                    existing_files=existing_files,
                 ),
                 node,
                 node.get("publishDate"),
+                image_executor=image_executor,
             )
 
             # Save audio file
-            return self._save_audio_file(audio_urls, filename, program_path, index + 1, total_count, node.get("publishDate"))
+            return self._save_audio_file(
+                audio_urls, filename, program_path, index + 1, total_count, node.get("publishDate"), expected_length=probed_sizes.get(audio_urls[0])
+            )
         except Exception as e:
             self.logger.error("Error processing node: %s", e)
             return False
 
+    @staticmethod
+    def _episode_filename(node_id: str, title: str) -> str:
+        """Build the base file name (without extension) shared by all files of an episode."""
+        array_filename = _TITLE_WORD_RE.findall(title)
+        filename_base = "_".join(array_filename) if array_filename else node_id
+        return f"{filename_base}_{node_id}"
+
     def _extract_image_urls(self, node: dict[str, Any]) -> dict[str, str]:
         """Extract image URLs from node."""
         image = node.get("image") or {}
@@ -669,9 +788,14 @@ class AudiothekDownloader:
 
     def _extract_audio_url(self, node: dict[str, Any]) -> list[str]:
         """Extract audio URLs from node, returning URLs in priority order."""
+        audio_urls, _ = self._extract_audio_urls_with_sizes(node)
+        return audio_urls
+
+    def _extract_audio_urls_with_sizes(self, node: dict[str, Any]) -> tuple[list[str], dict[str, int]]:
+        """Extract audio URLs in priority order together with the content lengths probed while ranking them."""
         audios = node.get("audios") or []
         if not audios:
-            return []
+            return [], {}
 
         download_urls, streaming_urls = self._collect_audio_urls(audios)
         download_urls = self._deduplicate_preserve_order(download_urls)
@@ -681,17 +805,17 @@ class AudiothekDownloader:
         self.logger.debug("Found %d streaming URLs: %s", len(streaming_urls), streaming_urls)
 
         if not download_urls and not streaming_urls:
-            return []
+            return [], {}
         if not download_urls:
-            return streaming_urls
+            return streaming_urls, {}
         if not streaming_urls:
-            return download_urls
+            return download_urls, {}
 
         url_candidates = self._build_audio_url_candidates(download_urls, streaming_urls)
         priority_urls = self._prioritize_audio_urls(download_urls, streaming_urls, url_candidates)
 
         self.logger.debug("Chosen URLs in priority order: %s", priority_urls)
-        return priority_urls
+        return priority_urls, {url: size for _, url, size in url_candidates}
 
     def _collect_audio_urls(self, audios: list[dict[str, Any]]) -> tuple[list[str], list[str]]:
         """Collect download and streaming URLs from audio nodes."""
@@ -776,34 +900,80 @@ class AudiothekDownloader:
                     merged.append(url)
         return merged
 
-    def _save_images_and_metadata(self, metadata: ImageMetadata, node: dict[str, Any], publish_date: str | None = None) -> None:
-        """Save images and metadata files."""
-        # Save images
-        image_file_path = os.path.join(metadata.program_path, metadata.filename + ".jpg")
-        image_file_x1_path = os.path.join(metadata.program_path, metadata.filename + "_x1.jpg")
+    def _save_image(self, url: str, image_file_path: str, description: str, publish_date: str | None = None) -> None:
+        """Download a single cover image unless another worker already saved it."""
+        with self._locked_file_operation(image_file_path, "write"):
+            if os.path.exists(image_file_path):
+                return
+            try:
+                if not self._copy_downloaded_image(url, image_file_path):
+                    self.client._download_to_file(url, image_file_path)
+                    self._image_paths_by_url[url] = image_file_path
+                if publish_date:
+                    set_file_modification_time(image_file_path, publish_date, self.logger)
+            except Exception as e:
+                self.logger.error("Failed to download %s: %s", description, e)
 
-        if metadata.image_urls["image_url"]:
-            with self._locked_file_operation(image_file_path, "write"):
-                if not os.path.exists(image_file_path):
-                    try:
-                        self.client._download_to_file(metadata.image_urls["image_url"], image_file_path)
-                        if publish_date:
-                            set_file_modification_time(image_file_path, publish_date, self.logger)
-                    except Exception as e:
-                        self.logger.error("Failed to download image: %s", e)
+    def _copy_downloaded_image(self, url: str, image_file_path: str) -> bool:
+        """Copy an image already downloaded from the same URL in this session.
 
-        if metadata.image_urls["image_url_x1"]:
-            with self._locked_file_operation(image_file_x1_path, "write"):
-                if not os.path.exists(image_file_x1_path):
-                    try:
-                        self.client._download_to_file(metadata.image_urls["image_url_x1"], image_file_x1_path)
-                        if publish_date:
-                            set_file_modification_time(image_file_x1_path, publish_date, self.logger)
-                    except Exception as e:
-                        self.logger.error("Failed to download square image: %s", e)
+        Episodes of a show usually share the show's cover art, so this avoids
+        fetching identical bytes once per episode. A copy (not a hard link) is
+        made so each file can carry its own episode's modification time.
+
+        Args:
+            url: Image URL about to be downloaded
+            image_file_path: Destination path for the image
+
+        Returns:
+            True if the image was copied, False if it still needs downloading
+
+        """
+        source_path = self._image_paths_by_url.get(url)
+        if source_path is None or source_path == image_file_path:
+            return False
+        try:
+            shutil.copyfile(source_path, image_file_path)
+        except OSError as e:
+            self.logger.debug("Could not reuse downloaded image %s, downloading again: %s", source_path, e)
+            return False
+        self.logger.debug("Reused previously downloaded image for %s: %s", url, image_file_path)
+        return True
+
+    def _save_images_and_metadata(
+        self,
+        metadata: ImageMetadata,
+        node: dict[str, Any],
+        publish_date: str | None = None,
+        *,
+        image_executor: concurrent.futures.Executor | None = None,
+    ) -> None:
+        """Save images and metadata files, fetching the covers side by side when an image pool is given."""
+        # Join the program folder once; every asset shares the same base path
+        base_path = os.path.join(metadata.program_path, metadata.filename)
+
+        # Save images
+        image_file_path = base_path + ".jpg"
+        image_file_x1_path = base_path + "_x1.jpg"
+
+        pending_images = []
+        if metadata.image_urls["image_url"] and metadata.filename + ".jpg" not in metadata.existing_files:
+            pending_images.append((metadata.image_urls["image_url"], image_file_path, "image"))
+        if metadata.image_urls["image_url_x1"] and metadata.filename + "_x1.jpg" not in metadata.existing_files:
+            pending_images.append((metadata.image_urls["image_url_x1"], image_file_x1_path, "square image"))
+
+        # Both covers come from the same CDN: hand the second to the image pool and fetch
+        # the first on this worker, so the two requests overlap
+        futures = []
+        if image_executor is not None:
+            futures = [image_executor.submit(self._save_image, *image, publish_date) for image in pending_images[1:]]
+            pending_images = pending_images[:1]
+        for image in pending_images:
+            self._save_image(*image, publish_date)
+        concurrent.futures.wait(futures)
 
         # Save metadata
-        meta_file_path = os.path.join(metadata.program_path, metadata.filename + ".json")
+        meta_file_path = base_path + ".json"
         data = {
             "id": metadata.node_id,
             "title": metadata.title,
@@ -827,7 +997,15 @@ class AudiothekDownloader:
                 set_file_modification_time(meta_file_path, publish_date, self.logger)
 
     def _save_audio_file(
-        self, audio_urls: list[str], filename: str, program_path: str, current_index: int, total_count: int, publish_date: str | None = None
+        self,
+        audio_urls: list[str],
+        filename: str,
+        program_path: str,
+        current_index: int,
+        total_count: int,
+        publish_date: str | None = None,
+        *,
+        expected_length: int | None = None,
     ) -> bool:
         """Save audio file with appropriate extension based on URL format.
 
@@ -838,6 +1016,8 @@ class AudiothekDownloader:
             current_index: Current episode index for logging
             total_count: Total number of episodes for logging
             publish_date: Publish date for setting file modification time
+            expected_length: Content length of the preferred URL if it was already probed;
+                skips the availability check for an existing file
 
         Returns:
             True if successful, False otherwise
@@ -860,8 +1040,11 @@ class AudiothekDownloader:
         with self._locked_file_operation(audio_file_path, "write"):
             should_download = True
             if os.path.exists(audio_file_path):
-                # Check file availability and get content length
-                is_available, expected_length = self.client._check_file_availability(preferred_url)
+                # Check file availability and get content length, unless the URL was just probed
+                if expected_length is None:
+                    is_available, expected_length = self.client._check_file_availability(preferred_url)
+                else:
+                    is_available = True
                 if not is_available:
                     self.logger.warning("Audio file not available (404), keeping existing file: %s", audio_file_path)
                     should_download = False
@@ -1,5 +1,6 @@
 """File utility functions for the audiothek-downloader."""
 
+import functools
 import json
 import logging
 import os
@@ -66,15 +67,12 @@ def compare_json_content(file_path: str, new_data: dict[str, Any]) -> bool:
         True if file exists and content matches, False otherwise
 
     """
-    if not os.path.exists(file_path):
-        return False
-
     try:
         with open(file_path) as f:
             existing_data = json.load(f)
         return existing_data == new_data
     except (json.JSONDecodeError, OSError):
-        # If file is corrupted or can't be read, don't skip
+        # Missing (FileNotFoundError), corrupted or unreadable files are never skipped
         return False
 
 
@@ -94,9 +92,11 @@ def safe_write_json(file_path: str, data: dict[str, Any], logger: logging.Logger
     lock = filelock.FileLock(lock_path)
 
     try:
+        # Serialize before taking the lock and write the document in a single call
+        payload = json.dumps(data, indent=4).encode("utf-8")
         with lock:
-            with open(file_path, "w") as f:
-                json.dump(data, f, indent=4)
+            with open(file_path, "wb") as f:
+                f.write(payload)
         return FileOperationResult(success=True, message="Successfully wrote JSON data", file_path=file_path)
     except Exception as e:
         logger.error("Failed to write JSON data to %s: %s", file_path, e)
@@ -109,6 +109,21 @@ def safe_write_json(file_path: str, data: dict[str, Any], logger: logging.Logger
                 pass
 
 
+@functools.lru_cache(maxsize=256)
+def _publish_date_timestamp(publish_date: str) -> float:
+    """Convert an API publish date to a POSIX timestamp.
+
+    Every asset of an episode shares the same publish date, so the parse is cached.
+    """
+    # Parse the publish date - ARD Audiothek typically uses ISO 8601 format
+    # Example: "2023-12-01T10:00:00.000Z" or "2023-12-01T10:00:00Z"
+    if publish_date.endswith("Z"):
+        # Handle UTC timestamp
+        return datetime.fromisoformat(publish_date.replace("Z", "+00:00")).timestamp()
+    # Handle timestamp without timezone info
+    return datetime.fromisoformat(publish_date).timestamp()
+
+
 def set_file_modification_time(file_path: str, publish_date: str, logger: logging.Logger) -> bool:
     """Set file modification time based on publish date.
 
@@ -122,17 +137,7 @@ def set_file_modification_time(file_path: str, publish_date: str, logger: loggin
 
     """
     try:
-        # Parse the publish date - ARD Audiothek typically uses ISO 8601 format
-        # Example: "2023-12-01T10:00:00.000Z" or "2023-12-01T10:00:00Z"
-        if publish_date.endswith("Z"):
-            # Handle UTC timestamp
-            dt = datetime.fromisoformat(publish_date.replace("Z", "+00:00"))
-        else:
-            # Handle timestamp without timezone info
-            dt = datetime.fromisoformat(publish_date)
-
-        # Convert to timestamp and set file modification time
-        timestamp = dt.timestamp()
+        timestamp = _publish_date_timestamp(publish_date)
         os.utime(file_path, (timestamp, timestamp))
         logger.debug("Set file modification time for %s to %s", file_path, publish_date)
         return True
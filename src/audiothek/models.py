@@ -1,6 +1,6 @@
 """Data models for the audiothek-downloader."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 
@@ -14,6 +14,7 @@ class ImageMetadata:
     program_path: str
     program_set: dict[str, Any]
     image_urls: dict[str, str]
+    existing_files: frozenset[str] = field(default_factory=frozenset)
 
 
 @dataclass
@@ -28,7 +29,7 @@ class AudioInfo:
     duration: int | None = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EpisodeMetadata:
     """Metadata for an episode."""
 
@@ -48,7 +49,7 @@ class EpisodeMetadata:
     def __post_init__(self) -> None:
         """Initialize default values."""
         if self.audio_urls is None:
-            self.audio_urls = []
+            object.__setattr__(self, "audio_urls", [])
 
 
 @dataclass
@@ -68,7 +69,7 @@ class ProgramSetMetadata:
     broadcast_duration: int | None = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ResourceInfo:
     """Information about a resource."""
 
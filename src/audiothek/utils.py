@@ -1,3 +1,4 @@
+import functools
 import logging
 import os
 import re
@@ -10,7 +11,15 @@ if TYPE_CHECKING:
 REQUEST_TIMEOUT = 30
 MAX_FOLDER_NAME_LENGTH = 100
 
+_INVALID_FOLDER_CHARS_RE = re.compile(r'[<>:"/\\|?*]')
+_WHITESPACE_RUN_RE = re.compile(r"\s+")
+_GRAPHQL_COMMENT_RE = re.compile(r"#[^\n]*")
 
+# Source-tree location of the bundled GraphQL queries (fallback when package resources are unavailable)
+_GRAPHQL_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "graphql")
+
+
+@functools.lru_cache(maxsize=1024)
 def sanitize_folder_name(name: str) -> str:
     """Sanitize a string to be used as a folder name.
 
@@ -23,20 +32,43 @@ def sanitize_folder_name(name: str) -> str:
     """
     # Remove or replace characters that are problematic in folder names
     # Replace forward slashes and other problematic characters with underscores
-    sanitized = re.sub(r'[<>:"/\\|?*]', "_", name)
+    sanitized = _INVALID_FOLDER_CHARS_RE.sub("_", name)
     # Remove leading/trailing whitespace and dots
     sanitized = sanitized.strip(" .")
     # Replace multiple spaces with single space
-    sanitized = re.sub(r"\s+", " ", sanitized)
+    sanitized = _WHITESPACE_RUN_RE.sub(" ", sanitized)
     # Limit length to avoid filesystem issues
     if len(sanitized) > MAX_FOLDER_NAME_LENGTH:
         sanitized = sanitized[:MAX_FOLDER_NAME_LENGTH].rstrip()
     return sanitized
 
 
+def _normalize_graphql_query(query: str) -> str:
+    """Strip comments and collapse whitespace so formatting edits don't change the query text.
+
+    Documents containing string literals are only trimmed, since whitespace and ``#``
+    inside strings are significant.
+
+    Args:
+        query: The raw GraphQL document
+
+    Returns:
+        The normalized GraphQL document
+
+    """
+    if '"' in query:
+        return query.strip()
+    return _WHITESPACE_RUN_RE.sub(" ", _GRAPHQL_COMMENT_RE.sub("", query)).strip()
+
+
+@functools.cache
 def load_graphql_query(filename: str) -> str:
     """Load GraphQL query from file.
 
+    The query files ship with the package and never change at runtime, so each
+    file is read and normalized once and served from memory afterwards. The
+    normalized text keeps cache keys stable across cosmetic edits of the files.
+
     Args:
         filename: The GraphQL query filename
 
@@ -46,14 +78,13 @@ def load_graphql_query(filename: str) -> str:
     """
     # Prefer package resources so installed wheels/sdists work reliably.
     try:
-        return resources.files("audiothek").joinpath("graphql").joinpath(filename).read_text(encoding="utf-8")
+        query = resources.files("audiothek").joinpath("graphql").joinpath(filename).read_text(encoding="utf-8")
     except (FileNotFoundError, ModuleNotFoundError):
         # Fallback for local source-tree execution.
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        graphql_dir = os.path.join(base_dir, "graphql")
-        query_path = os.path.join(graphql_dir, filename)
+        query_path = os.path.join(_GRAPHQL_DIR, filename)
         with open(query_path, encoding="utf-8") as f:
-            return f.read()
+            query = f.read()
+    return _normalize_graphql_query(query)
 
 
 def migrate_folders(folder: str, downloader: "AudiothekDownloader", logger: logging.Logger) -> None:
@@ -73,38 +104,39 @@ def migrate_folders(folder: str, downloader: "AudiothekDownloader", logger: logg
 
     # Find all subdirectories with numeric IDs
     try:
-        for item in os.listdir(folder):
-            item_path = os.path.join(folder, item)
-            if os.path.isdir(item_path):
-                # Check if the folder name is a pure numeric ID (old format)
-                if item.isdigit():
-                    logger.info("Found old format folder: %s", item)
-
-                    # Try to get the program title by making a request
-                    resource_result = downloader.client.determine_resource_type_from_id(item)
-                    if not resource_result:
-                        logger.warning("Could not determine resource type for folder: %s", item)
-                        continue
-
-                    # Extract resource type and ID from ResourceInfo object
-                    resource_type = resource_result.resource_type
-                    parsed_id = resource_result.resource_id
-
-                    # Get program information to extract the title
-                    title = downloader.client.get_title(parsed_id, resource_type)
-                    if title:
-                        # Create new folder name with ID and title
-                        new_folder_name = f"{item} {sanitize_folder_name(title)}"
-                        new_folder_path = os.path.join(folder, new_folder_name)
-
-                        # Rename the folder
-                        try:
-                            os.rename(item_path, new_folder_path)
-                            logger.info("Renamed: %s -> %s", item, new_folder_name)
-                        except OSError as e:
-                            logger.error("Failed to rename folder %s: %s", item, e)
-                    else:
-                        logger.warning("Could not get title for folder: %s", item)
+        # Snapshot the listing first: folders are renamed while iterating
+        with os.scandir(folder) as entries:
+            folder_entries = [(entry.name, entry.path) for entry in entries if entry.is_dir()]
+        for item, item_path in folder_entries:
+            # Check if the folder name is a pure numeric ID (old format)
+            if item.isdigit():
+                logger.info("Found old format folder: %s", item)
+
+                # Try to get the program title by making a request
+                resource_result = downloader.client.determine_resource_type_from_id(item)
+                if not resource_result:
+                    logger.warning("Could not determine resource type for folder: %s", item)
+                    continue
+
+                # Extract resource type and ID from ResourceInfo object
+                resource_type = resource_result.resource_type
+                parsed_id = resource_result.resource_id
+
+                # Get program information to extract the title
+                title = downloader.client.get_title(parsed_id, resource_type)
+                if title:
+                    # Create new folder name with ID and title
+                    new_folder_name = f"{item} {sanitize_folder_name(title)}"
+                    new_folder_path = os.path.join(folder, new_folder_name)
+
+                    # Rename the folder
+                    try:
+                        os.rename(item_path, new_folder_path)
+                        logger.info("Renamed: %s -> %s", item, new_folder_name)
+                    except OSError as e:
+                        logger.error("Failed to rename folder %s: %s", item, e)
+                else:
+                    logger.warning("Could not get title for folder: %s", item)
 
     except Exception as e:
         logger.error("Error while migrating folders: %s", e)
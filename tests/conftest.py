@@ -1,7 +1,6 @@
-import json
 import os
-from dataclasses import dataclass
-from typing import Any, Callable
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator
 
 import pytest
 from graphql import GraphQLSchema, build_schema, parse, validate
@@ -12,6 +11,7 @@ from graphql.language.ast import OperationDefinitionNode
 class MockResponse:
     _json: dict[str, Any] | None = None
     content: bytes = b""
+    headers: dict[str, str] = field(default_factory=dict)
 
     def json(self) -> dict[str, Any]:
         if self._json is None:
@@ -21,6 +21,13 @@ class MockResponse:
     def raise_for_status(self) -> None:
         return None
 
+    def iter_content(self, chunk_size: int = 1) -> Iterator[bytes]:
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start : start + chunk_size]
+
+    def close(self) -> None:
+        return None
+
 
 class GraphQLMock:
     def __init__(self, schema: GraphQLSchema) -> None:
@@ -181,7 +188,7 @@ class GraphQLMock:
                     "coreDocument": {"key": "value"},
                     "rowId": 1,
                     "nodeId": "node_ps1",
-                    "items": {"pageInfo": {"hasNextPage": has_next, "endCursor": ""}, "nodes": nodes}
+                    "items": {"pageInfo": {"hasNextPage": has_next, "endCursor": ""}, "totalCount": 4, "nodes": nodes}
                 }
             else:
                 # Include editorial collection metadata
@@ -221,20 +228,22 @@ def graphql_mock(graphql_schema: GraphQLSchema) -> GraphQLMock:
 
 @pytest.fixture()
 def mock_requests_get(monkeypatch: pytest.MonkeyPatch, graphql_mock: GraphQLMock) -> Callable[..., MockResponse]:
-    def _mock_session_get(self, url: str, params: dict[str, Any] | None = None, timeout: int | None = None, **kwargs: Any) -> MockResponse:  # noqa: ARG001
+    def _mock_session_post(self, url: str, json: dict[str, Any] | None = None, timeout: int | None = None, **kwargs: Any) -> MockResponse:  # noqa: ARG001
         if url == "https://api.ardaudiothek.de/graphql":
-            assert params is not None
-            query = params["query"]
-            variables = json.loads(params["variables"])
-            payload = graphql_mock.handle(query, variables)
+            assert json is not None
+            payload = graphql_mock.handle(json["query"], json["variables"])
             return MockResponse(_json=payload)
 
+        raise AssertionError(f"Unexpected URL posted to: {url}")
+
+    def _mock_session_get(self, url: str, params: dict[str, Any] | None = None, timeout: int | None = None, **kwargs: Any) -> MockResponse:  # noqa: ARG001
         if url.startswith("https://cdn.test/"):
             return MockResponse(content=b"binary")
 
         raise AssertionError(f"Unexpected URL requested: {url}")
 
-    # Mock the Session.get method instead of requests.get
+    # Mock the Session methods instead of requests.get/requests.post
+    monkeypatch.setattr("requests.Session.post", _mock_session_post)
     monkeypatch.setattr("requests.Session.get", _mock_session_get)
     return _mock_session_get
 
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import json
+import sqlite3
+import threading
 from pathlib import Path
 from typing import Any
 
@@ -53,3 +56,205 @@ def test_graphql_cache_expires_entry(tmp_path: Path, monkeypatch: pytest.MonkeyP
     current_time["value"] += ttl + 1
     expired = cache.get(query, variables, "ExpiringQuery")
     assert expired is None
+
+
+def test_graphql_cache_pools_connections_across_threads(tmp_path: Path) -> None:
+    cache = GraphQLCache(cache_dir=str(tmp_path), ttl_seconds=3600, enabled=True)
+    query = "query Test { result }"
+
+    cache.set(query, {"id": "1"}, _fake_response(), "TestQuery")
+    assert cache.get(query, {"id": "1"}, "TestQuery") == _fake_response()
+    with cache._connect() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    # A short-lived worker thread borrows the idle connection instead of opening its own
+    worker_conns: list[Any] = []
+
+    def _borrow() -> None:
+        with cache._connect() as worker_conn:
+            worker_conns.append(worker_conn)
+
+    worker = threading.Thread(target=_borrow)
+    worker.start()
+    worker.join()
+    assert worker_conns == [conn]
+
+    # Overlapping borrowers get separate connections, and close() closes all of them
+    with cache._connect() as first, cache._connect() as second:
+        assert first is not second
+    cache.close()
+    for closed in (first, second):
+        with pytest.raises(sqlite3.ProgrammingError):
+            closed.execute("SELECT 1")
+
+    assert cache.get(query, {"id": "1"}, "TestQuery") == _fake_response()
+    cache.close()
+
+
+def test_graphql_cache_removes_expired_entries_in_one_sweep(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = GraphQLCache(cache_dir=str(tmp_path), ttl_seconds=10, enabled=True)
+    query = "query Test { result }"
+    current_time = {"value": 1_000.0}
+    monkeypatch.setattr("audiothek.cache.time.time", lambda: current_time["value"])
+
+    cache.set(query, {"id": "old"}, _fake_response(), "TestQuery")
+    current_time["value"] += 5
+    cache.set(query, {"id": "new"}, _fake_response(), "TestQuery")
+    current_time["value"] += 6
+
+    # The first lookup sweeps every expired row, not just the one being read
+    assert cache.get(query, {"id": "new"}, "TestQuery") == _fake_response()
+    with cache._connect() as conn:
+        rows = conn.execute("SELECT variables FROM graphql_cache").fetchall()
+    assert rows == [('{"id":"new"}',)]
+    cache.close()
+
+
+def test_graphql_cache_migrates_database_without_expires_at(tmp_path: Path) -> None:
+    conn = sqlite3.connect(tmp_path / "graphql_cache.sqlite3")
+    conn.execute(
+        "CREATE TABLE graphql_cache (cache_key TEXT PRIMARY KEY, query_name TEXT, query TEXT NOT NULL, "
+        "variables TEXT NOT NULL, response TEXT NOT NULL, updated_at REAL NOT NULL)"
+    )
+    conn.commit()
+    conn.close()
+
+    cache = GraphQLCache(cache_dir=str(tmp_path), ttl_seconds=3600, enabled=True)
+    query = "query Test { result }"
+    cache.set(query, {"id": "1"}, _fake_response(), "TestQuery")
+
+    assert cache.get(query, {"id": "1"}, "TestQuery") == _fake_response()
+    cache.close()
+
+
+def test_graphql_cache_get_does_not_wait_for_writer_lock(tmp_path: Path) -> None:
+    cache = GraphQLCache(cache_dir=str(tmp_path), ttl_seconds=3600, enabled=True)
+    query = "query Test { result }"
+    cache.set(query, {"id": "1"}, _fake_response(), "TestQuery")
+    cache.get(query, {"id": "1"}, "TestQuery")
+
+    # The writer lock is not reentrant, so this would deadlock if reads still acquired it
+    with cache._lock:
+        assert cache.get(query, {"id": "1"}, "TestQuery") == _fake_response()
+    cache.close()
+
+
+def test_graphql_cache_key_is_canonical_over_variables(tmp_path: Path) -> None:
+    cache = GraphQLCache(cache_dir=str(tmp_path), ttl_seconds=3600, enabled=True)
+    query = "query Test { result }"
+
+    key = cache._build_cache_key(query, {"id": "1", "offset": 0})
+
+    assert len(key) == 32
+    assert key == cache._build_cache_key(query, {"offset": 0, "id": "1"})
+    assert key != cache._build_cache_key(query, {"id": "1", "offset": 24})
+    assert key != cache._build_cache_key("query Other { result }", {"id": "1", "offset": 0})
+    cache.close()
+
+
+def test_graphql_cache_batch_writes_entries_when_outermost_batch_ends(tmp_path: Path) -> None:
+    cache = GraphQLCache(cache_dir=str(tmp_path), ttl_seconds=3600, enabled=True)
+    query = "query Test { result }"
+
+    def _row_count() -> int:
+        with cache._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM graphql_cache").fetchone()[0]
+
+    with cache.batch():
+        cache.set(query, {"id": "1"}, _fake_response(), "TestQuery")
+        with cache.batch():
+            cache.set(query, {"id": "2"}, _fake_response(), "TestQuery")
+        assert _row_count() == 0
+
+    assert _row_count() == 2
+    assert cache.get(query, {"id": "2"}, "TestQuery") == _fake_response()
+
+    cache.set_many([(query, {"id": "3"}, _fake_response(), "TestQuery"), (query, {"id": "4"}, _fake_response(), "TestQuery")])
+    assert _row_count() == 4
+    cache.close()
+
+
+def test_graphql_cache_batch_only_defers_threads_inside_it(tmp_path: Path) -> None:
+    cache = GraphQLCache(cache_dir=str(tmp_path), ttl_seconds=3600, enabled=True)
+    query = "query Test { result }"
+
+    def _in_thread(target: Any) -> None:
+        worker = threading.Thread(target=target)
+        worker.start()
+        worker.join()
+
+    with cache.batch() as pending:
+        cache.set(query, {"id": "owner"}, _fake_response(), "TestQuery")
+        # A thread outside the batch writes immediately
+        _in_thread(lambda: cache.set(query, {"id": "other"}, _fake_response(), "TestQuery"))
+        assert cache.get(query, {"id": "other"}, "TestQuery") == _fake_response()
+
+        # A worker that joins the batch defers its write to the owner
+        def _join() -> None:
+            with cache.batch(pending):
+                cache.set(query, {"id": "worker"}, _fake_response(), "TestQuery")
+
+        _in_thread(_join)
+        assert cache.get(query, {"id": "worker"}, "TestQuery") is None
+        assert [entry[1] for entry in pending] == [{"id": "owner"}, {"id": "worker"}]
+
+    assert cache.get(query, {"id": "owner"}, "TestQuery") == _fake_response()
+    assert cache.get(query, {"id": "worker"}, "TestQuery") == _fake_response()
+    cache.close()
+
+
+def test_graphql_cache_stores_compressed_responses_and_reads_legacy_text(tmp_path: Path) -> None:
+    cache = GraphQLCache(cache_dir=str(tmp_path), ttl_seconds=3600, enabled=True)
+    query = "query Test { result }"
+    response = {"data": {"result": {"nodes": [{"id": str(index), "title": "Episode title"} for index in range(50)]}}}
+
+    cache.set(query, {"id": "1"}, response, "TestQuery")
+    with cache._connect() as conn:
+        stored = conn.execute("SELECT response FROM graphql_cache").fetchone()[0]
+    assert isinstance(stored, bytes)
+    assert len(stored) < len(json.dumps(response))
+    assert cache.get(query, {"id": "1"}, "TestQuery") == response
+
+    with cache._connect() as conn, conn:
+        conn.execute("UPDATE graphql_cache SET response = ?", (json.dumps(response),))
+    assert cache.get(query, {"id": "1"}, "TestQuery") == response
+
+    with cache._connect() as conn, conn:
+        conn.execute("UPDATE graphql_cache SET response = ?", (b"not zlib",))
+    assert cache.get(query, {"id": "1"}, "TestQuery") is None
+    cache.close()
+
+
+def test_graphql_cache_applies_per_query_ttl(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = GraphQLCache(cache_dir=str(tmp_path), ttl_seconds=100, enabled=True, query_ttl_seconds={"SlowQuery": 1000, "FastQuery": 10})
+    query = "query Test { result }"
+    current_time = {"value": 1_000.0}
+    monkeypatch.setattr("audiothek.cache.time.time", lambda: current_time["value"])
+
+    for query_name in ("SlowQuery", "FastQuery", "OtherQuery"):
+        cache.set(query, {"name": query_name}, _fake_response(), query_name)
+
+    current_time["value"] += 50
+    assert cache.get(query, {"name": "FastQuery"}, "FastQuery") is None
+    assert cache.get(query, {"name": "OtherQuery"}, "OtherQuery") == _fake_response()
+    assert cache.get(query, {"name": "SlowQuery"}, "SlowQuery") == _fake_response()
+
+    current_time["value"] += 100
+    assert cache.get(query, {"name": "OtherQuery"}, "OtherQuery") is None
+    assert cache.get(query, {"name": "SlowQuery"}, "SlowQuery") == _fake_response()
+
+    current_time["value"] += 1000
+    assert cache.get(query, {"name": "SlowQuery"}, "SlowQuery") is None
+    cache.close()
+
+
+def test_graphql_cache_keeps_category_listings_for_a_day(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = GraphQLCache(cache_dir=str(tmp_path), enabled=True)
+    monkeypatch.setattr("audiothek.cache.time.time", lambda: 1_000.0)
+
+    cache.set("query Test { result }", {"id": "42"}, _fake_response(), "ProgramSetsByEditorialCategoryId")
+
+    with cache._connect() as conn:
+        (expires_at,) = conn.execute("SELECT expires_at FROM graphql_cache WHERE query_name = ?", ("ProgramSetsByEditorialCategoryId",)).fetchone()
+    assert expires_at == 1_000.0 + 24 * 60 * 60
+    cache.close()
@@ -2,6 +2,7 @@
 
 import json
 import os
+import threading
 from pathlib import Path
 from typing import Any
 from unittest.mock import Mock, patch
@@ -9,8 +10,11 @@ from unittest.mock import Mock, patch
 import pytest
 import requests
 from audiothek.exceptions import DownloadError
+from graphql import GraphQLSchema, parse, validate
 
-from audiothek import AudiothekClient, ResourceInfo
+from audiothek import AudiothekClient, ResourceInfo, load_graphql_query
+from audiothek.cache import GraphQLCache
+from tests.conftest import MockResponse
 
 
 class TestAudiothekClient:
@@ -45,8 +49,39 @@ class TestAudiothekClient:
         }
         assert client._session.proxies == expected_proxies
 
-    @patch('requests.Session.get')
-    def test_graphql_get_uses_proxy(self, mock_get: Mock) -> None:
+    def test_client_session_uses_pooled_adapter_with_retries(self) -> None:
+        """Test that the session mounts a pooled adapter with retries for transient errors."""
+        client = AudiothekClient()
+
+        adapter = client._session.get_adapter("https://api.ardaudiothek.de/graphql")
+        assert isinstance(adapter, requests.adapters.HTTPAdapter)
+        assert adapter._pool_maxsize == 32
+        assert adapter.max_retries.total == 3
+        assert 503 in adapter.max_retries.status_forcelist
+        assert client._session.headers["User-Agent"] == "audiothek-downloader"
+
+    def test_client_session_retries_graphql_posts(self) -> None:
+        """Test that transient errors on GraphQL POST requests are retried like GETs."""
+        client = AudiothekClient()
+
+        retry = client._session.get_adapter("https://api.ardaudiothek.de/graphql").max_retries
+        assert retry.is_retry("POST", 503)
+        assert retry.is_retry("POST", 429)
+        assert retry.is_retry("GET", 503)
+
+    def test_client_close_closes_session_and_cache_connections(self, tmp_path: Path) -> None:
+        """Test that closing the client releases the HTTP session and every cache database connection."""
+        cache = GraphQLCache(cache_dir=tmp_path, enabled=True)
+        cache.set("query Test { result }", {}, {"data": {}}, "Test")
+        client = AudiothekClient(cache=cache)
+
+        with patch.object(client._session, "close") as session_close:
+            client.close()
+
+        session_close.assert_called_once_with()
+        assert cache._connections == []
+    @patch('requests.Session.post')
+    def test_graphql_get_uses_proxy(self, mock_post: Mock) -> None:
         """Test that GraphQL requests use the configured proxy."""
         proxy_url = "http://proxy.example.com:8080"
         client = AudiothekClient(proxy=proxy_url)
@@ -54,31 +89,93 @@ class TestAudiothekClient:
         # Mock response
         mock_response = Mock()
         mock_response.json.return_value = {"data": {"result": {}}}
-        mock_get.return_value = mock_response
+        mock_post.return_value = mock_response
 
         # Make a GraphQL request
         client._graphql_get("query", {"var": "value"})
 
-        mock_get.assert_called_once()
+        mock_post.assert_called_once()
         assert client._session.proxies == {"http": proxy_url, "https": proxy_url}
 
+    @patch('requests.Session.post')
+    def test_graphql_get_posts_json_body(self, mock_post: Mock) -> None:
+        """Test that GraphQL queries are sent as a JSON POST body instead of URL parameters."""
+        mock_response = Mock()
+        mock_response.json.return_value = {"data": {"result": {}}}
+        mock_post.return_value = mock_response
+
+        client = AudiothekClient()
+        client._graphql_get("query Q { result }", {"id": "ps1", "offset": 0})
+
+        mock_post.assert_called_once_with(
+            "https://api.ardaudiothek.de/graphql",
+            json={"query": "query Q { result }", "variables": {"id": "ps1", "offset": 0}},
+            timeout=30,
+        )
+
+    @patch('requests.Session.post')
+    def test_graphql_get_shares_concurrent_identical_requests(self, mock_post: Mock) -> None:
+        """Test that a second caller of an identical in-flight query waits for the first response."""
+        request_started = threading.Event()
+        release_response = threading.Event()
+
+        def _slow_post(*args: Any, **kwargs: Any) -> Mock:
+            request_started.set()
+            release_response.wait(timeout=5)
+            mock_response = Mock()
+            mock_response.json.return_value = {"data": {"result": {"id": "ps1"}}}
+            return mock_response
+
+        mock_post.side_effect = _slow_post
+        client = AudiothekClient()
+        results: list[dict[str, Any]] = []
+
+        def _query() -> None:
+            results.append(client._graphql_get("query Q { result }", {"id": "ps1"}, "Q"))
+
+        first = threading.Thread(target=_query)
+        first.start()
+        assert request_started.wait(timeout=5)
+        second = threading.Thread(target=_query)
+        second.start()
+        second.join(timeout=0.2)
+        release_response.set()
+        first.join()
+        second.join()
+
+        assert mock_post.call_count == 1
+        assert results == [{"data": {"result": {"id": "ps1"}}}] * 2
+        assert client._inflight == {}
+
     @patch('requests.Session.get')
-    def test_download_to_file_uses_proxy(self, mock_get: Mock) -> None:
+    def test_download_to_file_uses_proxy(self, mock_get: Mock, tmp_path: Path) -> None:
         """Test that file downloads use the configured proxy."""
         proxy_url = "http://proxy.example.com:8080"
         client = AudiothekClient(proxy=proxy_url)
 
         # Mock response
-        mock_response = Mock()
-        mock_response.content = b"test content"
-        mock_get.return_value = mock_response
+        mock_get.return_value = self._streamed_response(b"test content")
 
         # Make a file download request
-        client._download_to_file("http://example.com/file.mp3", "/tmp/test.mp3")
+        client._download_to_file("http://example.com/file.mp3", str(tmp_path / "test.mp3"))
 
         mock_get.assert_called_once()
         assert client._session.proxies == {"http": proxy_url, "https": proxy_url}
 
+    @patch('requests.Session.get')
+    def test_download_to_file_streams_body(self, mock_get: Mock, tmp_path: Path) -> None:
+        """Test that images are streamed to disk instead of materialized via response.content."""
+        mock_response = self._streamed_response(b"jpeg" * 100)
+        mock_get.return_value = mock_response
+        file_path = tmp_path / "cover.jpg"
+
+        client = AudiothekClient()
+        client._download_to_file("http://example.com/cover.jpg", str(file_path))
+
+        assert file_path.read_bytes() == b"jpeg" * 100
+        mock_get.assert_called_once_with("http://example.com/cover.jpg", stream=True, timeout=30)
+        mock_response.close.assert_called_once()
+
     def test_parse_url_with_urn_episode(self) -> None:
         """Test parsing URL with episode URN."""
         client = AudiothekClient()
@@ -149,6 +246,13 @@ class TestAudiothekClient:
 
         assert result == ResourceInfo(resource_type="program", resource_id="ps1")
 
+    @pytest.mark.parametrize("resource_id", ["urn:ard:publication:test123", "urn:ard:episode", "urn:ard:"])
+    def test_determine_resource_type_from_id_other_urns_are_programs(self, resource_id: str) -> None:
+        """Test that URNs without a known type segment fall back to programs."""
+        result = AudiothekClient.determine_resource_type_from_id(resource_id)
+
+        assert result == ResourceInfo(resource_type="program", resource_id=resource_id)
+
     def test_determine_resource_type_from_id_invalid(self) -> None:
         """Test determining resource type from invalid ID."""
         client = AudiothekClient()
@@ -156,6 +260,15 @@ class TestAudiothekClient:
 
         assert result is None
 
+    def test_determine_resource_type_from_id_rejects_trailing_newline(self) -> None:
+        """Test that an alphanumeric ID followed by a newline is not accepted."""
+        assert AudiothekClient.determine_resource_type_from_id("ps1\n") is None
+
+    def test_determine_resource_type_from_id_rejects_non_ascii_alphanumerics(self) -> None:
+        """Test that only ASCII letters and digits are accepted as plain program IDs."""
+        assert AudiothekClient.determine_resource_type_from_id("sendung1") == ResourceInfo(resource_type="program", resource_id="sendung1")
+        assert AudiothekClient.determine_resource_type_from_id("straße1") is None
+
     @patch.object(AudiothekClient, '_graphql_get')
     @patch('audiothek.client.load_graphql_query')
     def test_get_episode_title(self, mock_load_query: Mock, mock_graphql_get: Mock) -> None:
@@ -173,8 +286,35 @@ class TestAudiothekClient:
         result = client.get_episode_title("urn:ard:episode:test123")
 
         assert result == "Test Program"
-        mock_load_query.assert_called_once_with("EpisodeQuery.graphql")
-        mock_graphql_get.assert_called_once_with("query", {"id": "urn:ard:episode:test123"}, "EpisodeQuery")
+        mock_load_query.assert_called_once_with("EpisodeTitleQuery.graphql")
+        mock_graphql_get.assert_called_once_with("query", {"id": "urn:ard:episode:test123"}, "EpisodeTitleQuery")
+
+    @patch.object(AudiothekClient, "get_episode_data")
+    def test_get_episode_metadata_maps_node_fields(self, mock_episode_data: Mock) -> None:
+        """Test that an episode node is mapped to EpisodeMetadata, skipping empty audio and image URLs."""
+        mock_episode_data.return_value = {
+            "id": 42,
+            "title": "Episode",
+            "publishDate": "2024-01-01T00:00:00Z",
+            "programSet": {"id": "ps1", "title": "Program", "path": "/ps1"},
+            "audios": [{"downloadUrl": "https://cdn.test/a.mp3", "url": "https://cdn.test/a.m4a"}, {"url": None}, "bogus"],
+            "image": {"url": "https://cdn.test/img_{width}.jpg", "url1X1": None},
+        }
+
+        client = AudiothekClient()
+        metadata = client.get_episode_metadata("42")
+
+        assert metadata is not None
+        assert (metadata.id, metadata.program_set_title, metadata.program_set_path) == ("42", "Program", "/ps1")
+        assert metadata.audio_urls == ["https://cdn.test/a.mp3", "https://cdn.test/a.m4a"]
+        assert (metadata.image_url, metadata.image_url_x1) == ("https://cdn.test/img_2000.jpg", "")
+
+    def test_episode_title_query_selects_only_program_set_title(self, graphql_schema: GraphQLSchema) -> None:
+        """Test that the title query is valid against the schema and selects nothing but the program set title."""
+        query = load_graphql_query("EpisodeTitleQuery.graphql")
+
+        assert validate(graphql_schema, parse(query)) == []
+        assert query == "query EpisodeTitleQuery($id: ID!) { result: item(id: $id) { programSet { title } } }"
 
     @patch.object(AudiothekClient, '_graphql_get')
     @patch('audiothek.client.load_graphql_query')
@@ -288,18 +428,32 @@ class TestAudiothekClient:
         mock_program_title.assert_called_once_with("program123")
         mock_episode_title.assert_not_called()
 
-    @patch.object(AudiothekClient, 'get_episode_title')
+    @patch.object(AudiothekClient, 'get_collection_title')
     @patch.object(AudiothekClient, 'get_program_set_title')
-    def test_get_title_collection(self, mock_program_title: Mock, mock_episode_title: Mock) -> None:
+    def test_get_title_collection(self, mock_program_title: Mock, mock_collection_title: Mock) -> None:
         """Test getting title for collection resource."""
-        mock_program_title.return_value = "Collection Title"
+        mock_collection_title.return_value = "Collection Title"
 
         client = AudiothekClient()
         result = client.get_title("collection123", "collection")
 
         assert result == "Collection Title"
-        mock_program_title.assert_called_once_with("collection123")
-        mock_episode_title.assert_not_called()
+        mock_collection_title.assert_called_once_with("collection123")
+        mock_program_title.assert_not_called()
+
+    @patch.object(AudiothekClient, '_graphql_get')
+    def test_get_collection_title_uses_title_only_query(self, mock_graphql_get: Mock, graphql_schema: GraphQLSchema) -> None:
+        """Test that collection titles come from a query selecting no collection items."""
+        mock_graphql_get.return_value = {"data": {"result": {"title": "Collection Title"}}}
+
+        client = AudiothekClient()
+        result = client.get_collection_title("urn:ard:page:abc")
+
+        assert result == "Collection Title"
+        query, variables, query_name = mock_graphql_get.call_args.args
+        assert (variables, query_name) == ({"id": "urn:ard:page:abc"}, "CollectionTitleQuery")
+        assert validate(graphql_schema, parse(query)) == []
+        assert "items" not in query
 
     @patch.object(AudiothekClient, 'get_episode_title')
     @patch.object(AudiothekClient, 'get_program_set_title')
@@ -341,36 +495,48 @@ class TestAudiothekClient:
         mock_program_title.assert_called_once_with("program123")
         mock_episode_title.assert_not_called()
 
-    @patch('requests.Session.get')
-    def test_fetch_and_validate_audio_success(self, mock_get: Mock) -> None:
-        """Test successful audio fetch and validation."""
+    @staticmethod
+    def _streamed_response(content: bytes) -> Mock:
+        """Build a mock streamed response yielding content in chunks."""
         mock_response = Mock()
-        mock_response.content = b"valid audio content" * 1000  # Large enough to pass validation
+        mock_response.headers = {"Content-Length": str(len(content))}
         mock_response.raise_for_status.return_value = None
+        mock_response.iter_content.return_value = iter([content[:100], content[100:]])
+        return mock_response
+
+    @patch('requests.Session.get')
+    def test_fetch_and_validate_audio_success(self, mock_get: Mock, tmp_path: Path) -> None:
+        """Test successful audio fetch streams content to file."""
+        mock_response = self._streamed_response(b"valid audio content" * 1000)  # Large enough to pass validation
         mock_get.return_value = mock_response
+        file_path = tmp_path / "audio.mp3"
 
         client = AudiothekClient()
-        result = client._fetch_and_validate_audio("http://example.com/audio.mp3")
+        result = client._fetch_and_validate_audio("http://example.com/audio.mp3", str(file_path))
 
-        assert result == b"valid audio content" * 1000
-        mock_get.assert_called_once_with("http://example.com/audio.mp3", timeout=30)
+        assert result is True
+        assert file_path.read_bytes() == b"valid audio content" * 1000
+        mock_get.assert_called_once_with("http://example.com/audio.mp3", stream=True, timeout=30)
+        mock_response.close.assert_called_once()
 
     @patch('requests.Session.get')
-    def test_fetch_and_validate_audio_404(self, mock_get: Mock) -> None:
+    def test_fetch_and_validate_audio_404(self, mock_get: Mock, tmp_path: Path) -> None:
         """Test audio fetch with 404 error."""
         mock_response = Mock()
         mock_response.status_code = 404
         error = requests.HTTPError("404 Not Found")
         error.response = mock_response
         mock_get.side_effect = error
+        file_path = tmp_path / "audio.mp3"
 
         client = AudiothekClient()
-        result = client._fetch_and_validate_audio("http://example.com/audio.mp3")
+        result = client._fetch_and_validate_audio("http://example.com/audio.mp3", str(file_path))
 
-        assert result is None
+        assert result is False
+        assert not file_path.exists()
 
     @patch('requests.Session.get')
-    def test_fetch_and_validate_audio_http_error(self, mock_get: Mock) -> None:
+    def test_fetch_and_validate_audio_http_error(self, mock_get: Mock, tmp_path: Path) -> None:
         """Test audio fetch with non-404 HTTP error."""
         mock_response = Mock()
         mock_response.status_code = 500
@@ -381,57 +547,198 @@ class TestAudiothekClient:
         client = AudiothekClient()
 
         with pytest.raises(DownloadError):
-            client._fetch_and_validate_audio("http://example.com/audio.mp3")
+            client._fetch_and_validate_audio("http://example.com/audio.mp3", str(tmp_path / "audio.mp3"))
+
+    @pytest.mark.parametrize(("body", "is_error"), [(b"<html>File Not Found</html>", True), (b"ID3\x04\x00" + b"\xff" * 64, False)])
+    def test_is_error_response_file_matches_indicators_case_insensitively(self, tmp_path: Path, body: bytes, is_error: bool) -> None:
+        """Test that small bodies are sniffed for error indicators regardless of case."""
+        file_path = tmp_path / "audio.mp3"
+        file_path.write_bytes(body)
+
+        client = AudiothekClient()
+
+        assert client._is_error_response_file("http://example.com/audio.mp3", str(file_path), len(body)) is is_error
 
     @patch('requests.Session.get')
-    def test_fetch_and_validate_audio_small_error_response(self, mock_get: Mock) -> None:
-        """Test audio fetch with small error response."""
-        mock_response = Mock()
-        mock_response.content = b"error: file not found"
-        mock_response.raise_for_status.return_value = None
+    def test_fetch_and_validate_audio_rejects_error_page_without_reading_body(self, mock_get: Mock, tmp_path: Path) -> None:
+        """Test that a text/html response is treated as unavailable before its body is streamed."""
+        mock_response = self._streamed_response(b"<html>" + b"x" * 5000 + b"</html>")
+        mock_response.headers["Content-Type"] = "text/html; charset=utf-8"
         mock_get.return_value = mock_response
+        file_path = tmp_path / "audio.mp3"
 
         client = AudiothekClient()
-        result = client._fetch_and_validate_audio("http://example.com/audio.mp3")
+        result = client._fetch_and_validate_audio("http://example.com/audio.mp3", str(file_path))
 
-        assert result is None
+        assert result is False
+        assert not file_path.exists()
+        mock_response.iter_content.assert_not_called()
+        mock_response.close.assert_called_once()
 
     @patch('requests.Session.get')
-    def test_fetch_and_validate_audio_small_valid_response(self, mock_get: Mock) -> None:
+    def test_fetch_and_validate_audio_small_error_response(self, mock_get: Mock, tmp_path: Path) -> None:
+        """Test audio fetch with small error response removes the written file."""
+        mock_get.return_value = self._streamed_response(b"error: file not found")
+        file_path = tmp_path / "audio.mp3"
+
+        client = AudiothekClient()
+        result = client._fetch_and_validate_audio("http://example.com/audio.mp3", str(file_path))
+
+        assert result is False
+        assert not file_path.exists()
+
+    @patch('requests.Session.get')
+    def test_fetch_and_validate_audio_small_valid_response(self, mock_get: Mock, tmp_path: Path) -> None:
         """Test audio fetch with small but valid response."""
-        mock_response = Mock()
-        mock_response.content = b"valid audio content but small"
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        mock_get.return_value = self._streamed_response(b"valid audio content but small")
+        file_path = tmp_path / "audio.mp3"
 
         client = AudiothekClient()
-        result = client._fetch_and_validate_audio("http://example.com/audio.mp3")
+        result = client._fetch_and_validate_audio("http://example.com/audio.mp3", str(file_path))
 
-        assert result == b"valid audio content but small"
+        assert result is True
+        assert file_path.read_bytes() == b"valid audio content but small"
 
     @patch("audiothek.client.time.sleep")
     @patch("requests.Session.get")
-    def test_fetch_and_validate_audio_retries_incomplete_read_then_succeeds(self, mock_get: Mock, mock_sleep: Mock) -> None:
+    def test_fetch_and_validate_audio_retries_incomplete_read_then_succeeds(self, mock_get: Mock, mock_sleep: Mock, tmp_path: Path) -> None:
         """Retry same URL on transient incomplete-read errors."""
-        mock_response = Mock()
-        mock_response.content = b"valid audio content" * 1000
-        mock_response.raise_for_status.return_value = None
-
         incomplete_error = requests.ConnectionError(
             "Connection broken: IncompleteRead(16777216 bytes read, 52616056 more expected)"
         )
-        mock_get.side_effect = [incomplete_error, mock_response]
+        mock_get.side_effect = [incomplete_error, self._streamed_response(b"valid audio content" * 1000)]
+        file_path = tmp_path / "audio.mp3"
 
         client = AudiothekClient()
-        result = client._fetch_and_validate_audio("http://example.com/audio.mp3")
+        result = client._fetch_and_validate_audio("http://example.com/audio.mp3", str(file_path))
 
-        assert result == b"valid audio content" * 1000
+        assert result is True
+        assert file_path.read_bytes() == b"valid audio content" * 1000
         assert mock_get.call_count == 2
         mock_sleep.assert_called_once_with(0.5)
 
     @patch("audiothek.client.time.sleep")
     @patch("requests.Session.get")
-    def test_fetch_and_validate_audio_incomplete_read_exhausted(self, mock_get: Mock, mock_sleep: Mock) -> None:
+    def test_fetch_and_validate_audio_retries_incomplete_read_during_body(self, mock_get: Mock, mock_sleep: Mock, tmp_path: Path) -> None:
+        """Retry when the connection breaks while streaming the body and rewrite the file."""
+        broken_response = Mock()
+        broken_response.headers = {}
+        broken_response.raise_for_status.return_value = None
+
+        def _broken_iter(chunk_size: int = 1) -> Any:
+            yield b"partial"
+            raise requests.exceptions.ChunkedEncodingError("Connection broken: IncompleteRead(7 bytes read, 10 more expected)")
+
+        broken_response.iter_content.side_effect = _broken_iter
+        mock_get.side_effect = [broken_response, self._streamed_response(b"valid audio content" * 1000)]
+        file_path = tmp_path / "audio.mp3"
+
+        client = AudiothekClient()
+        result = client._fetch_and_validate_audio("http://example.com/audio.mp3", str(file_path))
+
+        assert result is True
+        assert file_path.read_bytes() == b"valid audio content" * 1000
+        broken_response.close.assert_called_once()
+        mock_sleep.assert_called_once_with(0.5)
+
+    @patch("audiothek.client.time.sleep")
+    @patch("requests.Session.get")
+    def test_fetch_and_validate_audio_resumes_partial_body_with_range(self, mock_get: Mock, mock_sleep: Mock, tmp_path: Path) -> None:
+        """Resume a broken transfer with a Range request when the server answers 206."""
+        content = b"valid audio content" * 1000
+        broken_response = Mock()
+        broken_response.headers = {}
+        broken_response.raise_for_status.return_value = None
+
+        def _broken_iter(chunk_size: int = 1) -> Any:
+            yield content[:100]
+            raise requests.exceptions.ChunkedEncodingError("Connection broken: IncompleteRead(100 bytes read, 18900 more expected)")
+
+        broken_response.iter_content.side_effect = _broken_iter
+        partial_response = Mock()
+        partial_response.headers = {}
+        partial_response.status_code = 206
+        partial_response.raise_for_status.return_value = None
+        partial_response.iter_content.return_value = iter([content[100:]])
+        mock_get.side_effect = [broken_response, partial_response]
+        file_path = tmp_path / "audio.mp3"
+
+        client = AudiothekClient()
+        result = client._fetch_and_validate_audio("http://example.com/audio.mp3", str(file_path))
+
+        assert result is True
+        assert file_path.read_bytes() == content
+        assert mock_get.call_args_list[1].kwargs["headers"] == {"Range": "bytes=100-"}
+
+    @patch("audiothek.client.time.sleep")
+    @patch("requests.Session.get")
+    def test_fetch_and_validate_audio_failure_keeps_existing_file(self, mock_get: Mock, mock_sleep: Mock, tmp_path: Path) -> None:
+        """Test that a failed transfer never touches the final path and cleans up its .part file."""
+        broken_response = Mock()
+        broken_response.headers = {}
+        broken_response.raise_for_status.return_value = None
+
+        def _broken_iter(chunk_size: int = 1) -> Any:
+            yield b"partial"
+            raise requests.ConnectionError("Connection reset by peer")
+
+        broken_response.iter_content.side_effect = _broken_iter
+        mock_get.return_value = broken_response
+        file_path = tmp_path / "audio.mp3"
+        file_path.write_bytes(b"previous version")
+
+        client = AudiothekClient()
+        with pytest.raises(DownloadError):
+            client._fetch_and_validate_audio("http://example.com/audio.mp3", str(file_path))
+
+        assert file_path.read_bytes() == b"previous version"
+        assert not (tmp_path / "audio.mp3.part").exists()
+
+    @patch("requests.Session.get")
+    def test_download_to_file_moves_completed_body_into_place(self, mock_get: Mock, tmp_path: Path) -> None:
+        """Test that downloads are written to a .part file and renamed only when complete."""
+        written_paths: list[str] = []
+        original_stream_to_file = AudiothekClient._stream_to_file
+
+        def _recording_stream_to_file(response: Any, file_path: str, **kwargs: Any) -> int:
+            written_paths.append(os.path.basename(file_path))
+            return original_stream_to_file(response, file_path, **kwargs)
+
+        mock_get.return_value = self._streamed_response(b"jpeg")
+        file_path = tmp_path / "cover.jpg"
+
+        client = AudiothekClient()
+        with patch.object(AudiothekClient, "_stream_to_file", side_effect=_recording_stream_to_file):
+            client._download_to_file("http://example.com/cover.jpg", str(file_path))
+
+        assert written_paths == ["cover.jpg.part"]
+        assert file_path.read_bytes() == b"jpeg"
+        assert not (tmp_path / "cover.jpg.part").exists()
+
+    @pytest.mark.skipif(not hasattr(os, "posix_fallocate"), reason="posix_fallocate not available")
+    def test_stream_to_file_preallocates_and_trims_on_broken_body(self, tmp_path: Path) -> None:
+        """Test that large bodies reserve Content-Length up front and a broken stream leaves only the written bytes."""
+        response = Mock()
+        response.headers = {"Content-Length": str(4 << 20)}
+
+        def _broken_iter(chunk_size: int = 1) -> Any:
+            yield b"x" * 100
+            raise requests.exceptions.ChunkedEncodingError("Connection broken")
+
+        response.iter_content.side_effect = _broken_iter
+        file_path = tmp_path / "audio.mp3"
+
+        with patch("audiothek.client.os.posix_fallocate", wraps=os.posix_fallocate) as mock_fallocate:
+            with pytest.raises(requests.exceptions.ChunkedEncodingError):
+                AudiothekClient._stream_to_file(response, str(file_path))
+
+        mock_fallocate.assert_called_once()
+        assert mock_fallocate.call_args.args[1:] == (0, 4 << 20)
+        assert file_path.stat().st_size == 100
+
+    @patch("audiothek.client.time.sleep")
+    @patch("requests.Session.get")
+    def test_fetch_and_validate_audio_incomplete_read_exhausted(self, mock_get: Mock, mock_sleep: Mock, tmp_path: Path) -> None:
         """Raise DownloadError after exhausting retry attempts for incomplete reads."""
         incomplete_error = requests.ConnectionError(
             "Connection broken: IncompleteRead(16777216 bytes read, 52616056 more expected)"
@@ -440,48 +747,39 @@ class TestAudiothekClient:
 
         client = AudiothekClient()
         with pytest.raises(DownloadError):
-            client._fetch_and_validate_audio("http://example.com/audio.mp3")
+            client._fetch_and_validate_audio("http://example.com/audio.mp3", str(tmp_path / "audio.mp3"))
 
         assert mock_get.call_count == 3
         assert mock_sleep.call_count == 2
 
     @patch.object(AudiothekClient, '_fetch_and_validate_audio')
-    @patch('builtins.open', create=True)
-    def test_download_audio_to_file_success(self, mock_open: Mock, mock_fetch: Mock) -> None:
+    def test_download_audio_to_file_success(self, mock_fetch: Mock) -> None:
         """Test successful audio download to file."""
-        mock_fetch.return_value = b"audio content"
-        mock_file = Mock()
-        mock_open.return_value.__enter__.return_value = mock_file
+        mock_fetch.return_value = True
 
         client = AudiothekClient()
         result = client._download_audio_to_file("http://example.com/audio.mp3", "/tmp/audio.mp3")
 
         assert result is True
-        mock_fetch.assert_called_once_with("http://example.com/audio.mp3")
-        mock_file.write.assert_called_once_with(b"audio content")
+        mock_fetch.assert_called_once_with("http://example.com/audio.mp3", "/tmp/audio.mp3")
 
     @patch.object(AudiothekClient, '_fetch_and_validate_audio')
     def test_download_audio_to_file_404_with_fallback(self, mock_fetch: Mock) -> None:
         """Test audio download with 404 and successful fallback."""
-        mock_fetch.side_effect = [None, b"fallback content"]
+        mock_fetch.side_effect = [False, True]
 
-        with patch('builtins.open', create=True) as mock_open:
-            mock_file = Mock()
-            mock_open.return_value.__enter__.return_value = mock_file
-
-            client = AudiothekClient()
-            result = client._download_audio_to_file("http://example.com/audio.mp3", "/tmp/audio.mp3", "http://example.com/fallback.mp3")
+        client = AudiothekClient()
+        result = client._download_audio_to_file("http://example.com/audio.mp3", "/tmp/audio.mp3", "http://example.com/fallback.mp3")
 
-            assert result is True
-            assert mock_fetch.call_count == 2
-            mock_fetch.assert_any_call("http://example.com/audio.mp3")
-            mock_fetch.assert_any_call("http://example.com/fallback.mp3")
-            mock_file.write.assert_called_once_with(b"fallback content")
+        assert result is True
+        assert mock_fetch.call_count == 2
+        mock_fetch.assert_any_call("http://example.com/audio.mp3", "/tmp/audio.mp3")
+        mock_fetch.assert_any_call("http://example.com/fallback.mp3", "/tmp/audio.mp3")
 
     @patch.object(AudiothekClient, '_fetch_and_validate_audio')
     def test_download_audio_to_file_both_fail(self, mock_fetch: Mock) -> None:
         """Test audio download when both primary and fallback fail."""
-        mock_fetch.return_value = None
+        mock_fetch.return_value = False
 
         client = AudiothekClient()
         result = client._download_audio_to_file("http://example.com/audio.mp3", "/tmp/audio.mp3", "http://example.com/fallback.mp3")
@@ -492,7 +790,7 @@ class TestAudiothekClient:
     @patch.object(AudiothekClient, '_fetch_and_validate_audio')
     def test_download_audio_to_file_fallback_exception(self, mock_fetch: Mock) -> None:
         """Test audio download when fallback throws exception."""
-        mock_fetch.side_effect = [None, Exception("Network error")]
+        mock_fetch.side_effect = [False, Exception("Network error")]
 
         client = AudiothekClient()
         result = client._download_audio_to_file("http://example.com/audio.mp3", "/tmp/audio.mp3", "http://example.com/fallback.mp3")
@@ -501,28 +799,20 @@ class TestAudiothekClient:
         assert mock_fetch.call_count == 2
 
     @patch.object(AudiothekClient, '_fetch_and_validate_audio')
-    def test_download_audio_to_file_no_fallback(self, mock_fetch: Mock) -> None:
-        """Test audio download without fallback URL."""
-        mock_fetch.return_value = b"audio content"
-
-        with patch('builtins.open', create=True) as mock_open:
-            mock_file = Mock()
-            mock_open.return_value.__enter__.return_value = mock_file
+    def test_download_audio_to_file_write_error(self, mock_fetch: Mock) -> None:
+        """Test audio download returns False when the file cannot be written."""
+        mock_fetch.side_effect = OSError("disk full")
 
-            client = AudiothekClient()
-            result = client._download_audio_to_file("http://example.com/audio.mp3", "/tmp/audio.mp3")
+        client = AudiothekClient()
+        result = client._download_audio_to_file("http://example.com/audio.mp3", "/tmp/audio.mp3", "http://example.com/fallback.mp3")
 
-            assert result is True
-            mock_fetch.assert_called_once_with("http://example.com/audio.mp3")
-            mock_file.write.assert_called_once_with(b"audio content")
+        assert result is False
+        mock_fetch.assert_called_once_with("http://example.com/audio.mp3", "/tmp/audio.mp3")
 
     @patch.object(AudiothekClient, "_fetch_and_validate_audio")
-    @patch("builtins.open", create=True)
-    def test_download_audio_to_file_retries_all_fallback_urls(self, mock_open: Mock, mock_fetch: Mock) -> None:
+    def test_download_audio_to_file_retries_all_fallback_urls(self, mock_fetch: Mock) -> None:
         """Test audio download retries through ordered fallback URL list."""
-        mock_fetch.side_effect = [None, None, b"third source content"]
-        mock_file = Mock()
-        mock_open.return_value.__enter__.return_value = mock_file
+        mock_fetch.side_effect = [False, False, True]
 
         client = AudiothekClient()
         result = client._download_audio_to_file(
@@ -536,15 +826,14 @@ class TestAudiothekClient:
 
         assert result is True
         assert mock_fetch.call_count == 3
-        mock_fetch.assert_any_call("http://example.com/audio.mp3")
-        mock_fetch.assert_any_call("http://example.com/fallback-1.mp3")
-        mock_fetch.assert_any_call("http://example.com/fallback-2.mp3")
-        mock_file.write.assert_called_once_with(b"third source content")
+        mock_fetch.assert_any_call("http://example.com/audio.mp3", "/tmp/audio.mp3")
+        mock_fetch.assert_any_call("http://example.com/fallback-1.mp3", "/tmp/audio.mp3")
+        mock_fetch.assert_any_call("http://example.com/fallback-2.mp3", "/tmp/audio.mp3")
 
     @patch.object(AudiothekClient, "_fetch_and_validate_audio")
     def test_download_audio_to_file_all_candidates_fail(self, mock_fetch: Mock) -> None:
         """Test audio download returns False when all URL candidates fail."""
-        mock_fetch.return_value = None
+        mock_fetch.return_value = False
 
         client = AudiothekClient()
         result = client._download_audio_to_file(
@@ -555,3 +844,182 @@ class TestAudiothekClient:
 
         assert result is False
         assert mock_fetch.call_count == 3
+
+    @staticmethod
+    def _paged_response(offset: int, count: int, total: int, number_of_elements: int | None = None, total_count: int | None = None) -> dict[str, Any]:
+        """Build a paginated items response for program set queries."""
+        nodes = [{"id": f"e{index}"} for index in range(offset, min(offset + count, total))]
+        items: dict[str, Any] = {"pageInfo": {"hasNextPage": offset + count < total}, "nodes": nodes}
+        if total_count is not None:
+            items["totalCount"] = total_count
+        return {
+            "data": {
+                "result": {
+                    "id": "ps1",
+                    "numberOfElements": total if number_of_elements is None else number_of_elements,
+                    "items": items,
+                }
+            }
+        }
+
+    @patch.object(AudiothekClient, "_graphql_get")
+    def test_fetch_program_set_episodes_prefetches_known_pages(self, mock_graphql_get: Mock) -> None:
+        """Test that pages implied by numberOfElements are all fetched and merged in order."""
+        mock_graphql_get.side_effect = lambda _query, variables, _name: self._paged_response(variables["offset"], variables["count"], 60)
+
+        client = AudiothekClient()
+        nodes = client.fetch_program_set_episodes("ps1")
+
+        assert [node["id"] for node in nodes] == [f"e{index}" for index in range(60)]
+        offsets = sorted(call.args[1]["offset"] for call in mock_graphql_get.call_args_list)
+        assert offsets == [0, 24, 48]
+
+    @patch.object(AudiothekClient, "_graphql_get")
+    def test_fetch_program_set_episodes_continues_past_undercounted_total(self, mock_graphql_get: Mock) -> None:
+        """Test that pagination continues sequentially when numberOfElements underestimates the pages."""
+        mock_graphql_get.side_effect = lambda _query, variables, _name: self._paged_response(variables["offset"], variables["count"], 60, number_of_elements=30)
+
+        client = AudiothekClient()
+        nodes = client.fetch_program_set_episodes("ps1")
+
+        assert len(nodes) == 60
+        assert mock_graphql_get.call_count == 3
+
+    @patch.object(AudiothekClient, "_graphql_get")
+    def test_fetch_program_set_episodes_prefetches_using_items_total_count(self, mock_graphql_get: Mock) -> None:
+        """Test that the connection's totalCount takes precedence over numberOfElements for prefetching."""
+        page_threads: dict[int, threading.Thread] = {}
+
+        def _respond(_query: str, variables: dict[str, Any], _name: str) -> dict[str, Any]:
+            page_threads[variables["offset"]] = threading.current_thread()
+            return self._paged_response(variables["offset"], variables["count"], 60, number_of_elements=30, total_count=60)
+
+        mock_graphql_get.side_effect = _respond
+
+        client = AudiothekClient()
+        nodes = client.fetch_program_set_episodes("ps1")
+
+        assert [node["id"] for node in nodes] == [f"e{index}" for index in range(60)]
+        # Both follow-up pages were known up front and came from the prefetch pool
+        assert page_threads[0] is threading.main_thread()
+        assert page_threads[24] is not threading.main_thread()
+        assert page_threads[48] is not threading.main_thread()
+
+    @patch.object(AudiothekClient, "_graphql_get")
+    def test_fetch_program_set_episodes_respects_limit(self, mock_graphql_get: Mock) -> None:
+        """Test that prefetching never requests more nodes than the limit."""
+        mock_graphql_get.side_effect = lambda _query, variables, _name: self._paged_response(variables["offset"], variables["count"], 100)
+
+        client = AudiothekClient()
+        nodes = client.fetch_program_set_episodes("ps1", limit=30)
+
+        assert len(nodes) == 30
+        counts = sorted((call.args[1]["offset"], call.args[1]["count"]) for call in mock_graphql_get.call_args_list)
+        assert counts == [(0, 24), (24, 6)]
+
+    @patch.object(AudiothekClient, "_graphql_get")
+    def test_fetch_program_set_episodes_non_positive_limit_sends_no_request(self, mock_graphql_get: Mock) -> None:
+        """Test that a limit of zero or less returns nothing without querying the API."""
+        client = AudiothekClient()
+
+        assert client.fetch_program_set_episodes("ps1", limit=0) == []
+        assert client.fetch_program_set("ps1", limit=-1) == ([], {})
+        mock_graphql_get.assert_not_called()
+
+    @patch.object(AudiothekClient, "_graphql_get")
+    def test_find_program_sets_by_editorial_category_id_fetches_pages_concurrently(self, mock_graphql_get: Mock) -> None:
+        """Test that category pages are requested in concurrent windows and merged in offset order."""
+        page_threads: dict[int, threading.Thread] = {}
+
+        def _respond(_query: str, variables: dict[str, Any], _name: str) -> dict[str, Any]:
+            offset, count = variables["offset"], variables["count"]
+            page_threads[offset] = threading.current_thread()
+            nodes = [{"id": f"ps{index}"} for index in range(offset, min(offset + count, 60))]
+            return {"data": {"result": {"pageInfo": {"hasNextPage": offset + count < 60}, "nodes": nodes}}}
+
+        mock_graphql_get.side_effect = _respond
+
+        client = AudiothekClient()
+        nodes = client.find_program_sets_by_editorial_category_id("cat1")
+
+        assert [node["id"] for node in nodes] == [f"ps{index}" for index in range(60)]
+        # The first window speculatively covers four pages; the empty fourth one is discarded
+        assert sorted(page_threads) == [0, 24, 48, 72]
+        assert all(thread is not threading.main_thread() for thread in page_threads.values())
+
+    @patch.object(AudiothekClient, "_graphql_get")
+    def test_find_editorial_collections_by_editorial_category_id_stops_without_new_collections(self, mock_graphql_get: Mock) -> None:
+        """Test that collection pagination stops at the first page adding no new collections."""
+
+        def _respond(_query: str, variables: dict[str, Any], _name: str) -> dict[str, Any]:
+            offset = min(variables["offset"], 24)
+            nodes = [{"id": f"c{index}"} for index in range(offset, offset + 24)]
+            return {"data": {"result": {"sections": [{"nodes": nodes}, None]}}}
+
+        mock_graphql_get.side_effect = _respond
+
+        client = AudiothekClient()
+        collections = client.find_editorial_collections_by_editorial_category_id("cat1", limit=1000)
+
+        assert [collection["id"] for collection in collections] == [f"c{index}" for index in range(48)]
+        assert mock_graphql_get.call_count == 4
+
+    def test_find_program_sets_by_editorial_category_id_caches_pages_before_returning(self, tmp_path: Path) -> None:
+        """Test that breaking out of the page iterator still writes the window's pages to the cache before returning."""
+        client = AudiothekClient(cache=GraphQLCache(cache_dir=tmp_path, enabled=True))
+        requested: list[int] = []
+
+        def _post(_url: str, json: dict[str, Any], **_kwargs: Any) -> MockResponse:
+            offset = json["variables"]["offset"]
+            requested.append(offset)
+            nodes = [{"id": f"ps{offset}"}] if offset == 0 else []
+            return MockResponse(_json={"data": {"result": {"nodes": nodes, "pageInfo": {"hasNextPage": False}}}})
+
+        with patch.object(client._session, "post", side_effect=_post):
+            assert client.find_program_sets_by_editorial_category_id("cat1", limit=100) == [{"id": "ps0"}]
+            first_run = sorted(requested)
+            assert client.find_program_sets_by_editorial_category_id("cat1", limit=100) == [{"id": "ps0"}]
+
+        # The whole speculative window was fetched once and every page came from the cache the second time
+        assert first_run == [0, 24, 48, 72]
+        assert sorted(requested) == first_run
+        client.close()
+
+    @patch.object(AudiothekClient, "_graphql_get")
+    def test_find_editorial_collections_by_editorial_category_id_respects_limit(self, mock_graphql_get: Mock) -> None:
+        """Test that a limit off the page grid shrinks the last page and caps the collections returned."""
+
+        def _respond(_query: str, variables: dict[str, Any], _name: str) -> dict[str, Any]:
+            # Sections can hold more collections than were asked for
+            offset = variables["offset"]
+            nodes = [{"id": f"c{index}"} for index in range(offset, offset + 24)]
+            return {"data": {"result": {"sections": [{"nodes": nodes}]}}}
+
+        mock_graphql_get.side_effect = _respond
+
+        client = AudiothekClient()
+        collections = client.find_editorial_collections_by_editorial_category_id("cat1", limit=30)
+
+        assert [collection["id"] for collection in collections] == [f"c{index}" for index in range(30)]
+        pages = sorted((call.args[1]["offset"], call.args[1]["count"]) for call in mock_graphql_get.call_args_list)
+        assert pages == [(0, 24), (24, 6)]
+
+    @patch.object(AudiothekClient, "_graphql_get")
+    def test_find_editorial_collections_by_editorial_category_id_keeps_first_occurrence(self, mock_graphql_get: Mock) -> None:
+        """Test that a collection repeated across sections keeps its first occurrence."""
+        mock_graphql_get.return_value = {
+            "data": {
+                "result": {
+                    "sections": [
+                        {"nodes": [{"id": "c1", "title": "First"}, {"id": None}]},
+                        {"nodes": [{"id": "c1", "title": "Repeat"}, {"id": "c2", "title": "Other"}]},
+                        {},
+                    ]
+                }
+            }
+        }
+
+        client = AudiothekClient()
+        collections = client.find_editorial_collections_by_editorial_category_id("cat1", limit=10)
+
+        assert collections == [{"id": "c1", "title": "First"}, {"id": "c2", "title": "Other"}]
@@ -107,7 +107,7 @@ def test_find_editorial_collections_by_editorial_category_id_breaks_on_no_new_co
     result = client.find_editorial_collections_by_editorial_category_id("ec123")
 
     assert len(result) == 1
-    assert call_count == 2  # Should make second call and then break
+    assert call_count == 4  # Second page adds nothing, so no window beyond the first speculative one is fetched
 
 
 def test_update_all_folders_nonexistent_directory(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture) -> None:
@@ -162,10 +162,10 @@ def test_get_program_title_collection_type(tmp_path: Path, monkeypatch: pytest.M
     """Test get_title with collection resource type."""
     client = AudiothekClient()
 
-    def _mock_get_program_set_title(resource_id):
+    def _mock_get_collection_title(resource_id):
         return "Collection Title"
 
-    monkeypatch.setattr(client, "get_program_set_title", _mock_get_program_set_title)
+    monkeypatch.setattr(client, "get_collection_title", _mock_get_collection_title)
 
     result = client.get_title("col123", "collection")
     assert result == "Collection Title"
@@ -176,11 +176,11 @@ def test_save_collection_data_error_handling(tmp_path: Path, monkeypatch: pytest
     downloader = AudiothekDownloader()
     collection_data = {"id": "test_ec", "title": "Test Collection"}
 
-    # Mock json.dump to raise an exception
-    def _mock_json_dump(*args, **kwargs):
+    # Mock json.dumps to raise an exception
+    def _mock_json_dumps(*args, **kwargs):
         raise ValueError("JSON error")
 
-    monkeypatch.setattr("json.dump", _mock_json_dump)
+    monkeypatch.setattr("audiothek.file_utils.json.dumps", _mock_json_dumps)
 
     with caplog.at_level("ERROR"):
         downloader._save_collection_data(collection_data, str(tmp_path), is_editorial_collection=True)
@@ -193,11 +193,11 @@ def test_save_collection_data_program_set_error_handling(tmp_path: Path, monkeyp
     downloader = AudiothekDownloader()
     collection_data = {"id": "test_ps", "title": "Test Program Set"}
 
-    # Mock json.dump to raise an exception
-    def _mock_json_dump(*args, **kwargs):
+    # Mock json.dumps to raise an exception
+    def _mock_json_dumps(*args, **kwargs):
         raise ValueError("JSON error")
 
-    monkeypatch.setattr("json.dump", _mock_json_dump)
+    monkeypatch.setattr("audiothek.file_utils.json.dumps", _mock_json_dumps)
 
     with caplog.at_level("ERROR"):
         downloader._save_collection_data(collection_data, str(tmp_path), is_editorial_collection=False)
@@ -1,8 +1,9 @@
 """Tests for download functionality."""
 
 import json
-import os
 import logging
+import os
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -10,6 +11,7 @@ from typing import Any
 import pytest
 import requests
 
+from audiothek import downloader as downloader_module
 from audiothek import AudiothekDownloader, ResourceInfo
 from audiothek.file_utils import set_file_modification_time
 from audiothek.models import DownloadResult
@@ -54,11 +56,83 @@ def test_download_collection_paginates_and_writes(tmp_path: Path, mock_requests_
 
     # Ensure pagination occurred: graphql was called twice for ProgramSetEpisodesQuery
     calls = [c for c in graphql_mock.calls if c["operation"] == "ProgramSetEpisodesQuery"]
-    assert len(calls) == 3  # 2 for pagination + 1 for program set metadata
+    assert len(calls) == 2  # program set metadata comes from the first page, no extra request
     assert calls[0]["variables"]["offset"] == 0
     assert calls[1]["variables"]["offset"] == 24
 
 
+def test_download_collection_skips_episodes_when_folder_complete(tmp_path: Path, mock_requests_get: object, graphql_mock: GraphQLMock) -> None:
+    """Test that a program folder already holding every episode only refreshes the collection metadata."""
+    program_dir = tmp_path / "ps1 Prog"
+    program_dir.mkdir()
+    # The mocked program publishes e1/e2 on the first page and e25/e26 on the second
+    for index in (1, 2, 25, 26):
+        (program_dir / f"Episode_{index}_e{index}.mp3").write_bytes(b"audio")
+    # A second format of the same episode and a backup must not count as extra episodes
+    (program_dir / "Episode_1_e1.m4a").write_bytes(b"audio")
+    (program_dir / "Episode_2_e2.mp3.bak").write_bytes(b"audio")
+
+    downloader = AudiothekDownloader()
+    result = downloader._download_collection("ps1", str(tmp_path), is_editorial_collection=False)
+
+    assert result.success
+    assert "up to date" in result.message
+    calls = [c for c in graphql_mock.calls if c["operation"] == "ProgramSetEpisodesQuery"]
+    assert [c["variables"]["offset"] for c in calls] == [0, 24]
+    assert (program_dir / "ps1.json").exists()
+    assert not list(program_dir.glob("*_e1.json"))
+
+
+def test_download_collection_fetches_episode_missing_behind_a_depublished_one(tmp_path: Path, mock_requests_get: object, graphql_mock: GraphQLMock) -> None:
+    """Test that a depublished local episode does not hide a missing one on a later page."""
+    program_dir = tmp_path / "ps1 Prog"
+    program_dir.mkdir()
+    # Four local episodes for four published ones and every first-page episode is present,
+    # but e3 was depublished and e26 on the second page was never downloaded
+    for index in (1, 2, 3, 25):
+        (program_dir / f"Episode_{index}_e{index}.mp3").write_bytes(b"audio")
+
+    downloader = AudiothekDownloader()
+    result = downloader._download_collection("ps1", str(tmp_path), is_editorial_collection=False)
+
+    assert "up to date" not in result.message
+    assert (program_dir / "Episode_26_e26.mp3").exists()
+    assert (program_dir / "Episode_26_e26.json").exists()
+
+
+def test_download_collection_fetches_all_pages_when_local_episodes_differ(tmp_path: Path, mock_requests_get: object, graphql_mock: GraphQLMock) -> None:
+    """Test that matching episode counts do not count as complete when the local episodes are not the published ones."""
+    program_dir = tmp_path / "ps1 Prog"
+    program_dir.mkdir()
+    # Four local episodes for four published ones, but e3 was depublished and e1 is new on the first page
+    for index in (2, 3, 25, 26):
+        (program_dir / f"Episode_{index}_e{index}.mp3").write_bytes(b"audio")
+
+    downloader = AudiothekDownloader()
+    result = downloader._download_collection("ps1", str(tmp_path), is_editorial_collection=False)
+
+    assert "up to date" not in result.message
+    calls = [c for c in graphql_mock.calls if c["operation"] == "ProgramSetEpisodesQuery"]
+    assert [c["variables"]["offset"] for c in calls] == [0, 24]
+    assert (program_dir / "Episode_1_e1.mp3").exists()
+    assert (program_dir / "Episode_1_e1.json").exists()
+
+
+def test_download_collection_fetches_all_pages_when_folder_incomplete(tmp_path: Path, mock_requests_get: object, graphql_mock: GraphQLMock) -> None:
+    """Test that a program folder missing episodes is fully paginated and filled in."""
+    program_dir = tmp_path / "ps1 Prog"
+    program_dir.mkdir()
+    for index in range(1, 4):
+        (program_dir / f"Episode_{index}_e{index}.mp3").write_bytes(b"audio")
+
+    downloader = AudiothekDownloader()
+    downloader._download_collection("ps1", str(tmp_path), is_editorial_collection=False)
+
+    calls = [c for c in graphql_mock.calls if c["operation"] == "ProgramSetEpisodesQuery"]
+    assert [c["variables"]["offset"] for c in calls] == [0, 24]
+    assert (program_dir / "Episode_25_e25.json").exists()
+
+
 def test_save_nodes_skips_when_no_audio(tmp_path: Path, mock_requests_get: object) -> None:
     downloader = AudiothekDownloader()
     downloader._save_nodes(
@@ -77,7 +151,7 @@ def test_save_nodes_skips_when_no_audio(tmp_path: Path, mock_requests_get: objec
 
 
 def test_download_single_episode_not_found_logs_and_returns(tmp_path: Path, caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch) -> None:
-    def _mock_get(self, url: str, params: dict | None = None, timeout: int | None = None, **kwargs: Any):
+    def _mock_post(self, url: str, json: dict | None = None, timeout: int | None = None, **kwargs: Any):
         class _Resp:
             def json(self):
                 return {"data": {"result": None}}
@@ -86,7 +160,7 @@ def test_download_single_episode_not_found_logs_and_returns(tmp_path: Path, capl
                 pass
         return _Resp()
 
-    monkeypatch.setattr("requests.Session.get", _mock_get)
+    monkeypatch.setattr("requests.Session.post", _mock_post)
 
     with caplog.at_level("ERROR"):
         downloader = AudiothekDownloader()
@@ -96,13 +170,12 @@ def test_download_single_episode_not_found_logs_and_returns(tmp_path: Path, capl
 
 
 def test_download_collection_no_results_breaks(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, graphql_mock: GraphQLMock) -> None:
-    def _mock_get(self, url: str, params: dict | None = None, timeout: int | None = None, **kwargs: Any):
-        if url == "https://api.ardaudiothek.de/graphql":
-            # Return empty results to trigger break
-            return MockResponse(_json={"data": {"result": None}})
-        return MockResponse(content=b"binary")
+    def _mock_post(self, url: str, json: dict | None = None, timeout: int | None = None, **kwargs: Any):
+        assert url == "https://api.ardaudiothek.de/graphql"
+        # Return empty results to trigger break
+        return MockResponse(_json={"data": {"result": None}})
 
-    monkeypatch.setattr("requests.Session.get", _mock_get)
+    monkeypatch.setattr("requests.Session.post", _mock_post)
 
     # Should not create any directories since no results
     downloader = AudiothekDownloader()
@@ -112,12 +185,11 @@ def test_download_collection_no_results_breaks(tmp_path: Path, monkeypatch: pyte
 
 def test_download_collection_no_metadata_when_no_results(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     """Test that no metadata file is created when API returns no results."""
-    def _mock_get_no_results(self, url: str, params: dict | None = None, timeout: int | None = None, **kwargs: Any):
-        if url == "https://api.ardaudiothek.de/graphql":
-            return MockResponse(_json={"data": {"result": None}})
-        return MockResponse(content=b"binary")
+    def _mock_post_no_results(self, url: str, json: dict | None = None, timeout: int | None = None, **kwargs: Any):
+        assert url == "https://api.ardaudiothek.de/graphql"
+        return MockResponse(_json={"data": {"result": None}})
 
-    monkeypatch.setattr("requests.Session.get", _mock_get_no_results)
+    monkeypatch.setattr("requests.Session.post", _mock_post_no_results)
 
     downloader = AudiothekDownloader()
     downloader._download_collection("test_id", str(tmp_path), is_editorial_collection=False)
@@ -161,19 +233,9 @@ def test_save_nodes_does_not_redownload_existing_files(tmp_path: Path, monkeypat
 
     calls: list[str] = []
 
-    def _get(self, url: str, params: dict | None = None, timeout: int | None = None):
+    def _get(self, url: str, params: dict | None = None, timeout: int | None = None, **kwargs: Any):
         calls.append(f"GET:{url}")
-
-        class _Resp:
-            content = b"new"
-
-            def json(self):
-                return {}
-
-            def raise_for_status(self):
-                pass
-
-        return _Resp()
+        return MockResponse(_json={}, content=b"new")
 
     def _head(self, url: str, timeout: int | None = None):
         calls.append(f"HEAD:{url}")
@@ -221,19 +283,9 @@ def test_save_nodes_redownloads_incomplete_files(tmp_path: Path, monkeypatch: py
 
     calls: list[str] = []
 
-    def _get(self, url: str, params: dict | None = None, timeout: int | None = None):
+    def _get(self, url: str, params: dict | None = None, timeout: int | None = None, **kwargs: Any):
         calls.append(f"GET:{url}")
-
-        class _Resp:
-            content = b"new"
-
-            def json(self):
-                return {}
-
-            def raise_for_status(self):
-                pass
-
-        return _Resp()
+        return MockResponse(_json={}, content=b"new")
 
     def _head(self, url: str, timeout: int | None = None):
         calls.append(f"HEAD:{url}")
@@ -272,6 +324,185 @@ def test_save_nodes_redownloads_incomplete_files(tmp_path: Path, monkeypatch: py
     assert (program_dir / f"{filename}.mp3").read_bytes() == b"new"
 
 
+def test_save_nodes_reuses_ranking_head_for_existing_audio(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the HEAD made while ranking audio URLs is not repeated for the existing-file size check."""
+    program_dir = tmp_path / "ps1 Prog"
+    program_dir.mkdir(parents=True)
+    filename = "Existing_e1_e1"
+    (program_dir / f"{filename}.mp3").write_bytes(b"complete!!")  # 10 bytes
+
+    calls: list[str] = []
+
+    def _get(self, url: str, **kwargs: Any):
+        calls.append(f"GET:{url}")
+        return MockResponse(content=b"new")
+
+    def _head(self, url: str, timeout: int | None = None):
+        calls.append(f"HEAD:{url}")
+        return MockResponse(headers={"content-length": "10" if "download" in url else "5"})
+
+    monkeypatch.setattr("requests.Session.get", _get)
+    monkeypatch.setattr("requests.Session.head", _head)
+
+    downloader = AudiothekDownloader()
+    downloader._save_nodes(
+        [
+            {
+                "id": "e1",
+                "title": "Existing e1",
+                "audios": [{"downloadUrl": "https://cdn.test/download.mp3", "url": "https://cdn.test/stream.mp3"}],
+                "programSet": {"id": "ps1", "title": "Prog"},
+            }
+        ],
+        str(tmp_path),
+    )
+
+    assert calls == ["HEAD:https://cdn.test/download.mp3", "HEAD:https://cdn.test/stream.mp3"]
+    assert (program_dir / f"{filename}.mp3").read_bytes() == b"complete!!"
+
+
+def test_save_nodes_does_not_reuse_sizes_probed_in_an_earlier_run(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that content lengths probed while ranking one download never answer a later size check."""
+    program_dir = tmp_path / "ps1 Prog"
+    remote_size = {"value": 10}
+    calls: list[str] = []
+
+    def _get(self, url: str, **kwargs: Any):
+        calls.append(f"GET:{url}")
+        return MockResponse(content=b"x" * remote_size["value"])
+
+    def _head(self, url: str, timeout: int | None = None):
+        calls.append(f"HEAD:{url}")
+        return MockResponse(headers={"content-length": str(remote_size["value"]) if "download" in url else "5"})
+
+    monkeypatch.setattr("requests.Session.get", _get)
+    monkeypatch.setattr("requests.Session.head", _head)
+
+    downloader = AudiothekDownloader()
+    node = {
+        "id": "e1",
+        "title": "Episode",
+        "audios": [{"downloadUrl": "https://cdn.test/download.mp3", "url": "https://cdn.test/stream.mp3"}],
+        "programSet": {"id": "ps1", "title": "Prog"},
+    }
+    downloader._save_nodes([node], str(tmp_path))
+    assert (program_dir / "Episode_e1.mp3").read_bytes() == b"x" * 10
+
+    # The episode now only lists its download URL, which grew on the server
+    remote_size["value"] = 20
+    calls.clear()
+    downloader._save_nodes([{**node, "audios": [{"downloadUrl": "https://cdn.test/download.mp3"}]}], str(tmp_path))
+
+    assert calls == ["HEAD:https://cdn.test/download.mp3", "GET:https://cdn.test/download.mp3"]
+    assert (program_dir / "Episode_e1.mp3").read_bytes() == b"x" * 20
+
+
+def test_save_nodes_skips_existing_images_without_locking(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that images found in the program folder listing are neither locked nor re-checked."""
+    program_dir = tmp_path / "ps1 Prog"
+    program_dir.mkdir(parents=True)
+
+    filename = "Existing_e1_e1"
+    (program_dir / f"{filename}.jpg").write_bytes(b"old")
+    (program_dir / f"{filename}_x1.jpg").write_bytes(b"old")
+
+    locked_paths: list[str] = []
+    original_lock = AudiothekDownloader._locked_file_operation
+
+    def _recording_lock(self: AudiothekDownloader, file_path: str, operation: str) -> Any:
+        locked_paths.append(os.path.basename(file_path))
+        return original_lock(self, file_path, operation)
+
+    monkeypatch.setattr(AudiothekDownloader, "_locked_file_operation", _recording_lock)
+    monkeypatch.setattr("requests.Session.get", lambda self, url, **kwargs: MockResponse(content=b"new"))
+
+    downloader = AudiothekDownloader()
+    downloader._save_nodes(
+        [
+            {
+                "id": "e1",
+                "title": "Existing e1",
+                "image": {"url": "https://cdn.test/image_{width}.jpg", "url1X1": "https://cdn.test/image1x1_{width}.jpg"},
+                "audios": [{"downloadUrl": "https://cdn.test/audio.mp3"}],
+                "programSet": {"id": "ps1", "title": "Prog"},
+            }
+        ],
+        str(tmp_path),
+    )
+
+    assert locked_paths == [f"{filename}.mp3"]
+    assert (program_dir / f"{filename}.jpg").read_bytes() == b"old"
+    assert (program_dir / f"{filename}.mp3").read_bytes() == b"new"
+
+
+def test_save_nodes_downloads_both_cover_images_concurrently(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the square cover is fetched on the shared image pool while the node worker fetches the regular one."""
+    both_started = threading.Barrier(2, timeout=5)
+    image_threads: dict[str, str] = {}
+
+    def _mock_get(self: Any, url: str, **kwargs: Any) -> MockResponse:
+        if "image" in url:
+            image_threads[url] = threading.current_thread().name
+            # Fails with BrokenBarrierError unless the other image request is in flight too
+            both_started.wait()
+        return MockResponse(content=url.encode())
+
+    monkeypatch.setattr("requests.Session.get", _mock_get)
+    monkeypatch.setattr("requests.Session.head", lambda self, url, **kwargs: MockResponse())
+
+    downloader = AudiothekDownloader()
+    downloader._save_nodes(
+        [
+            {
+                "id": "e1",
+                "title": "Fresh",
+                "image": {"url": "https://cdn.test/image_{width}.jpg", "url1X1": "https://cdn.test/image1x1_{width}.jpg"},
+                "audios": [{"downloadUrl": "https://cdn.test/audio.mp3"}],
+                "programSet": {"id": "ps1", "title": "Prog"},
+            }
+        ],
+        str(tmp_path),
+    )
+
+    program_dir = tmp_path / "ps1 Prog"
+    assert (program_dir / "Fresh_e1.jpg").read_bytes() == b"https://cdn.test/image_2000.jpg"
+    assert (program_dir / "Fresh_e1_x1.jpg").read_bytes() == b"https://cdn.test/image1x1_2000.jpg"
+    assert image_threads["https://cdn.test/image_2000.jpg"] == threading.main_thread().name
+    assert image_threads["https://cdn.test/image1x1_2000.jpg"].startswith("audiothek-image")
+
+
+def test_save_nodes_downloads_shared_cover_image_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that episodes sharing cover art reuse the first download instead of fetching it again."""
+    image_requests: list[str] = []
+
+    def _mock_get(self: Any, url: str, **kwargs: Any) -> MockResponse:
+        if "image" in url:
+            image_requests.append(url)
+        return MockResponse(content=b"cover" if "image" in url else b"audio")
+
+    monkeypatch.setattr("requests.Session.get", _mock_get)
+    monkeypatch.setattr("requests.Session.head", lambda self, url, **kwargs: MockResponse())
+
+    downloader = AudiothekDownloader(max_workers=1)
+    downloader._save_nodes(
+        [
+            {
+                "id": f"e{i}",
+                "title": f"Episode {i}",
+                "image": {"url": "https://cdn.test/image_{width}.jpg"},
+                "audios": [{"downloadUrl": f"https://cdn.test/audio{i}.mp3"}],
+                "programSet": {"id": "ps1", "title": "Prog"},
+            }
+            for i in range(3)
+        ],
+        str(tmp_path),
+    )
+
+    assert image_requests == ["https://cdn.test/image_2000.jpg"]
+    for i in range(3):
+        assert (tmp_path / "ps1 Prog" / f"Episode_{i}_e{i}.jpg").read_bytes() == b"cover"
+
+
 def test_save_nodes_skips_smaller_files(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     """Test that files are not re-downloaded when new version is smaller."""
     program_dir = tmp_path / "ps1 Prog"
@@ -285,19 +516,9 @@ def test_save_nodes_skips_smaller_files(tmp_path: Path, monkeypatch: pytest.Monk
 
     calls: list[str] = []
 
-    def _get(self, url: str, params: dict | None = None, timeout: int | None = None):
+    def _get(self, url: str, params: dict | None = None, timeout: int | None = None, **kwargs: Any):
         calls.append(f"GET:{url}")
-
-        class _Resp:
-            content = b"new"
-
-            def json(self):
-                return {}
-
-            def raise_for_status(self):
-                pass
-
-        return _Resp()
+        return MockResponse(_json={}, content=b"new")
 
     def _head(self, url: str, timeout: int | None = None):
         calls.append(f"HEAD:{url}")
@@ -824,13 +1045,11 @@ def test_download_audio_file_uses_fallback_on_404(tmp_path: Path, monkeypatch: p
 
     call_count = 0
 
-    def _mock_get(self, url: str, timeout: int | None = None):
+    def _mock_get(self, url: str, timeout: int | None = None, **kwargs: Any):
         nonlocal call_count
         call_count += 1
 
-        class MockResponse:
-            content = b"valid audio content"
-
+        class _Resp(MockResponse):
             def raise_for_status(self):
                 if url == "https://example.com/primary.mp3":
                     # Primary URL - simulate 404
@@ -840,7 +1059,7 @@ def test_download_audio_file_uses_fallback_on_404(tmp_path: Path, monkeypatch: p
                     raise requests.HTTPError(response=response)
                 # Fallback URL succeeds
 
-        return MockResponse()
+        return _Resp(content=b"valid audio content")
 
     monkeypatch.setattr("requests.Session.get", _mock_get)
 
@@ -910,12 +1129,32 @@ def test_get_audio_quality_normalizes_bps_to_kbps(tmp_path: Path, monkeypatch: p
     class _MockAudio:
         info = _MockAudioInfo()
 
-    monkeypatch.setattr("audiothek.downloader.File", lambda _path: _MockAudio())
+    monkeypatch.setitem(downloader_module._AUDIO_LOADERS, ".mp3", lambda _path: _MockAudio())
 
     quality = downloader._get_audio_quality(str(audio_file))
     assert quality == 128
 
 
+def test_get_audio_quality_falls_back_to_generic_loader(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test _get_audio_quality only sniffs the format for extensions without a dedicated loader."""
+    downloader = AudiothekDownloader()
+    audio_file = tmp_path / "audio.ogg"
+    audio_file.write_bytes(b"dummy")
+    calls: list[str] = []
+
+    class _MockAudio:
+        info = type("_Info", (), {"bitrate": 64})()
+
+    def _mock_file(path: str) -> _MockAudio:
+        calls.append(path)
+        return _MockAudio()
+
+    monkeypatch.setattr("audiothek.downloader.File", _mock_file)
+
+    assert downloader._get_audio_quality(str(audio_file)) == 64
+    assert calls == [str(audio_file)]
+
+
 def test_compare_and_remove_files_handles_bps_bitrate_values(tmp_path: Path) -> None:
     """Test quality cleanup treats bps-returned values as kbps-equivalent thresholds."""
     downloader = AudiothekDownloader()
@@ -972,6 +1211,24 @@ def test_remove_lower_quality_files_dry_run_with_subdirs(tmp_path: Path, caplog:
     assert any("DRY RUN: Showing what would be removed" in msg for msg in log_messages)
 
 
+def test_remove_lower_quality_files_aggregates_parallel_folder_results(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test quality cleanup probes every program folder and sums their counts."""
+    for name in ("program1", "program2", "program3"):
+        folder = tmp_path / name
+        folder.mkdir()
+        (folder / "episode.mp3").write_bytes(b"fake mp3")
+        (folder / "episode.m4a").write_bytes(b"fake m4a")
+
+    downloader = AudiothekDownloader(max_workers=3)
+    monkeypatch.setattr(downloader, "_get_audio_quality", lambda file_path: 128 if file_path.endswith(".mp3") else 96)
+
+    result = downloader.remove_lower_quality_files(str(tmp_path))
+
+    assert result.success
+    assert result.message == "Quality cleanup completed. Removed: 3, Errors: 0"
+    assert sorted(p.name for p in tmp_path.rglob("*")) == ["episode.m4a"] * 3 + ["program1", "program2", "program3"]
+
+
 def test_process_folder_quality_dry_run(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
     """Test _process_folder_quality with dry_run=True."""
     downloader = AudiothekDownloader()
@@ -1036,13 +1293,13 @@ def test_process_folder_quality_error_handling(tmp_path: Path, caplog: pytest.Lo
     restricted_dir = tmp_path / "restricted"
     restricted_dir.mkdir()
 
-    # Mock os.listdir to raise an exception
-    def mock_listdir(path):
+    # Mock os.scandir to raise an exception
+    def mock_scandir(path):
         raise PermissionError("Permission denied")
 
     import audiothek.downloader
-    original_listdir = audiothek.downloader.os.listdir
-    audiothek.downloader.os.listdir = mock_listdir
+    original_scandir = audiothek.downloader.os.scandir
+    audiothek.downloader.os.scandir = mock_scandir
 
     try:
         with caplog.at_level("ERROR"):
@@ -1052,7 +1309,7 @@ def test_process_folder_quality_error_handling(tmp_path: Path, caplog: pytest.Lo
         log_messages = [r.message for r in caplog.records]
         assert any("Error processing folder" in msg for msg in log_messages)
     finally:
-        audiothek.downloader.os.listdir = original_listdir
+        audiothek.downloader.os.scandir = original_scandir
 
 
 def test_compare_and_remove_files_single_file(tmp_path: Path) -> None:
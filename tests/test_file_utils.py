@@ -4,7 +4,7 @@ import json
 import logging
 import os
 import tempfile
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -19,6 +19,7 @@ from audiothek.file_utils import (
     backup_file,
     restore_backup,
     get_file_size,
+    _publish_date_timestamp,
 )
 
 
@@ -225,6 +226,19 @@ class TestSafeWriteJson:
 
         mock_logger.error.assert_not_called()
 
+    def test_safe_write_json_writes_serialized_bytes(self, tmp_path: Path) -> None:
+        """Test safe_write_json writes the pre-serialized document in binary mode."""
+        mock_logger = Mock()
+        test_file = tmp_path / "test.json"
+        test_data = {"key": "value", "nested": {"list": [1, 2, 3]}}
+
+        with patch("builtins.open", wraps=open) as mock_open:
+            safe_write_json(str(test_file), test_data, mock_logger)
+
+        handle_calls = [call for call in mock_open.call_args_list if call.args[0] == str(test_file)]
+        assert handle_calls[0].args[1] == "wb"
+        assert test_file.read_text() == json.dumps(test_data, indent=4)
+
     def test_safe_write_json_with_complex_data(self, tmp_path: Path) -> None:
         """Test safe_write_json with complex nested data."""
         mock_logger = Mock()
@@ -259,11 +273,11 @@ class TestSafeWriteJson:
         assert result.file_path == "/restricted/file.json"
         mock_logger.error.assert_called_once()
 
-    @patch('json.dump')
-    def test_safe_write_json_json_error(self, mock_dump: Mock) -> None:
+    @patch('json.dumps')
+    def test_safe_write_json_json_error(self, mock_dumps: Mock) -> None:
         """Test safe_write_json handles JSON serialization errors."""
         mock_logger = Mock()
-        mock_dump.side_effect = TypeError("Object not serializable")
+        mock_dumps.side_effect = TypeError("Object not serializable")
 
         # Use a non-serializable object
         non_serializable = {"function": lambda x: x}
@@ -384,6 +398,20 @@ class TestSetFileModificationTime:
         assert result is False
         mock_logger.warning.assert_called_once()
 
+    def test_set_file_modification_time_reuses_parsed_publish_date(self, tmp_path: Path) -> None:
+        """Test that the files of one episode share a single publish date parse."""
+        publish_date = "2023-12-02T08:30:00Z"
+        files = [tmp_path / name for name in ("episode.mp3", "episode.jpg", "episode.json")]
+        for file in files:
+            file.write_text("content")
+        misses_before = _publish_date_timestamp.cache_info().misses
+
+        for file in files:
+            assert set_file_modification_time(str(file), publish_date, Mock()) is True
+
+        assert _publish_date_timestamp.cache_info().misses == misses_before + 1
+        assert {file.stat().st_mtime for file in files} == {datetime(2023, 12, 2, 8, 30, tzinfo=timezone.utc).timestamp()}
+
 
 class TestBackupFile:
     """Test cases for backup_file function."""
@@ -268,3 +268,28 @@ def test_migrate_folders_logs_warning_when_no_title(tmp_path: Path, monkeypatch:
 
     # Folder should still exist (no migration)
     assert (tmp_path / "123456").exists()
+
+
+def test_update_all_folders_dispatches_without_reclassifying_ids(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test update_all_folders dispatches folder IDs directly instead of going through download_from_id"""
+    (tmp_path / "123456").mkdir()
+    (tmp_path / "789012 Show Title").mkdir()
+
+    calls = []
+
+    def _mock_download_collection(self, resource_id, folder, is_editorial):
+        calls.append(resource_id)
+        return DownloadResult(success=True, message=f"Downloaded {resource_id}")
+
+    def _fail(*args: Any, **kwargs: Any) -> None:
+        raise AssertionError("folder IDs should not be re-classified")
+
+    monkeypatch.setattr(AudiothekDownloader, "_download_collection", _mock_download_collection)
+    monkeypatch.setattr(AudiothekDownloader, "download_from_id", _fail)
+    monkeypatch.setattr(AudiothekClient, "determine_resource_type_from_id", staticmethod(_fail))
+
+    result = AudiothekDownloader().update_all_folders(str(tmp_path))
+
+    assert result.success
+    assert result.message == "Update completed. Updated: 2, Errors: 0"
+    assert sorted(calls) == ["123456", "789012"]
@@ -229,6 +229,9 @@ def test_process_request_passes_cache_dir(tmp_path: Path, monkeypatch: pytest.Mo
         def download_from_url(self, url: str, folder: str) -> None:
             captured["download"] = {"url": url, "folder": folder}
 
+        def close(self) -> None:
+            captured["closed"] = True
+
     monkeypatch.setattr("audiothek.__main__.AudiothekDownloader", DummyDownloader)
 
     request = DownloadRequest(
@@ -247,6 +250,7 @@ def test_process_request_passes_cache_dir(tmp_path: Path, monkeypatch: pytest.Mo
     download_info = captured["download"]
     assert isinstance(download_info, dict)
     assert download_info["folder"] == str(tmp_path)
+    assert captured["closed"] is True
 
 
 def test_cli_main_parses_args_and_calls_downloader(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
@@ -260,6 +264,7 @@ def test_cli_main_parses_args_and_calls_downloader(tmp_path: Path, monkeypatch:
         calls.append(("download_from_url", url, folder))
 
     monkeypatch.setattr(AudiothekDownloader, "__init__", _mock_init)
+    monkeypatch.setattr(AudiothekDownloader, "close", lambda self: None)
     monkeypatch.setattr(AudiothekDownloader, "download_from_url", _mock_download_from_url)
 
     argv = [
@@ -300,6 +305,7 @@ def test_cli_main_with_http_proxy(tmp_path: Path, monkeypatch: pytest.MonkeyPatc
         calls.append(("download_from_url", url, folder))
 
     monkeypatch.setattr(AudiothekDownloader, "__init__", _mock_init)
+    monkeypatch.setattr(AudiothekDownloader, "close", lambda self: None)
     monkeypatch.setattr(AudiothekDownloader, "download_from_url", _mock_download_from_url)
 
     proxy_url = "http://proxy.example.com:8080"
@@ -337,6 +343,7 @@ def test_cli_main_with_socks5_proxy(tmp_path: Path, monkeypatch: pytest.MonkeyPa
         calls.append(("download_from_id", resource_id, folder))
 
     monkeypatch.setattr(AudiothekDownloader, "__init__", _mock_init)
+    monkeypatch.setattr(AudiothekDownloader, "close", lambda self: None)
     monkeypatch.setattr(AudiothekDownloader, "download_from_id", _mock_download_from_id)
 
     proxy_url = "socks5://socks-proxy.example.com:1080"
@@ -374,6 +381,7 @@ def test_cli_main_without_proxy(tmp_path: Path, monkeypatch: pytest.MonkeyPatch)
         calls.append(("download_from_url", url, folder))
 
     monkeypatch.setattr(AudiothekDownloader, "__init__", _mock_init)
+    monkeypatch.setattr(AudiothekDownloader, "close", lambda self: None)
     monkeypatch.setattr(AudiothekDownloader, "download_from_url", _mock_download_from_url)
 
     argv = ["audiothek", "--url", "https://example.com/u", "--folder", str(tmp_path)]
@@ -410,6 +418,7 @@ def test_process_request_with_proxy(tmp_path: Path, monkeypatch: pytest.MonkeyPa
         calls.append(("download_from_url", url, folder))
 
     monkeypatch.setattr(AudiothekDownloader, "__init__", _mock_init)
+    monkeypatch.setattr(AudiothekDownloader, "close", lambda self: None)
     monkeypatch.setattr(AudiothekDownloader, "download_from_url", _mock_download_from_url)
 
     proxy_url = "https://secure-proxy.example.com:3128"
@@ -462,6 +471,7 @@ def test_cli_main_with_remove_lower_quality(tmp_path: Path, monkeypatch: pytest.
         calls.append(("remove_lower_quality_files", folder, dry_run))
 
     monkeypatch.setattr(AudiothekDownloader, "__init__", _mock_init)
+    monkeypatch.setattr(AudiothekDownloader, "close", lambda self: None)
     monkeypatch.setattr(AudiothekDownloader, "remove_lower_quality_files", _mock_remove_lower_quality_files)
 
     argv = ["audiothek", "--remove-lower-quality", "--folder", str(tmp_path)]
@@ -504,6 +514,7 @@ def test_main_with_editorial_category_id(tmp_path: Path, monkeypatch: pytest.Mon
         )()
 
     monkeypatch.setattr(AudiothekDownloader, "__init__", _mock_init)
+    monkeypatch.setattr(AudiothekDownloader, "close", lambda self: None)
 
     # Test with editorial_category_id and search_type="all"
     request = DownloadRequest(editorial_category_id="12345", search_type="all", folder=str(tmp_path))
@@ -537,6 +548,7 @@ def test_main_with_editorial_category_id_program_sets_only(tmp_path: Path, monke
         })()
 
     monkeypatch.setattr(AudiothekDownloader, "__init__", _mock_init)
+    monkeypatch.setattr(AudiothekDownloader, "close", lambda self: None)
 
     # Test with editorial_category_id and search_type="program-sets"
     request = DownloadRequest(editorial_category_id="12345", search_type="program-sets", folder=str(tmp_path))
@@ -572,6 +584,7 @@ def test_main_with_editorial_category_id_collections_only(tmp_path: Path, monkey
         )()
 
     monkeypatch.setattr(AudiothekDownloader, "__init__", _mock_init)
+    monkeypatch.setattr(AudiothekDownloader, "close", lambda self: None)
 
     # Test with editorial_category_id and search_type="collections"
     request = DownloadRequest(editorial_category_id="12345", search_type="collections", folder=str(tmp_path))
@@ -602,6 +615,7 @@ def test_cli_main_with_remove_lower_quality_dry_run(tmp_path: Path, monkeypatch:
         calls.append(("remove_lower_quality_files", folder, dry_run))
 
     monkeypatch.setattr(AudiothekDownloader, "__init__", _mock_init)
+    monkeypatch.setattr(AudiothekDownloader, "close", lambda self: None)
     monkeypatch.setattr(AudiothekDownloader, "remove_lower_quality_files", _mock_remove_lower_quality_files)
 
     argv = ["audiothek", "--remove-lower-quality", "--dry-run", "--folder", str(tmp_path)]
@@ -17,13 +17,13 @@ def test_get_episode_title_api_response_handling(tmp_path: Path, monkeypatch: py
     client = AudiothekClient()
 
     # Test when API response has no data
-    def _mock_requests_get_no_data(self, *args, **kwargs):
+    def _mock_requests_post_no_data(self, *args, **kwargs):
         class MockResponse:
             def json(self):
                 return {"data": {}}
         return MockResponse()
 
-    monkeypatch.setattr("requests.Session.get", _mock_requests_get_no_data)
+    monkeypatch.setattr("requests.Session.post", _mock_requests_post_no_data)
 
     result = client.get_episode_title("test_id")
     assert result is None
@@ -33,13 +33,13 @@ def test_get_program_set_title_no_items(tmp_path: Path, monkeypatch: pytest.Monk
     """Test get_program_set_title when response has no items."""
     client = AudiothekClient()
 
-    def _mock_requests_get_no_items(self, *args, **kwargs):
+    def _mock_requests_post_no_items(self, *args, **kwargs):
         class MockResponse:
             def json(self):
                 return {"data": {"result": {}}}
         return MockResponse()
 
-    monkeypatch.setattr("requests.Session.get", _mock_requests_get_no_items)
+    monkeypatch.setattr("requests.Session.post", _mock_requests_post_no_items)
 
     result = client.get_program_set_title("test_id")
     assert result is None
@@ -49,39 +49,39 @@ def test_get_program_set_title_empty_nodes(tmp_path: Path, monkeypatch: pytest.M
     """Test get_program_set_title when nodes array is empty."""
     client = AudiothekClient()
 
-    def _mock_requests_get_empty_nodes(self, *args, **kwargs):
+    def _mock_requests_post_empty_nodes(self, *args, **kwargs):
         class MockResponse:
             def json(self):
                 return {"data": {"result": {"items": {"nodes": []}}}}
         return MockResponse()
 
-    monkeypatch.setattr("requests.Session.get", _mock_requests_get_empty_nodes)
+    monkeypatch.setattr("requests.Session.post", _mock_requests_post_empty_nodes)
 
     result = client.get_program_set_title("test_id")
     assert result is None
 
 
 def test_get_episode_title_requests_exception(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    """Test get_episode_title when requests.Session.get raises exception."""
+    """Test get_episode_title when requests.Session.post raises exception."""
     client = AudiothekClient()
 
-    def _mock_requests_get_exception(self, *args, **kwargs):
+    def _mock_requests_post_exception(self, *args, **kwargs):
         raise requests.exceptions.RequestException("Network error")
 
-    monkeypatch.setattr("requests.Session.get", _mock_requests_get_exception)
+    monkeypatch.setattr("requests.Session.post", _mock_requests_post_exception)
 
     result = client.get_episode_title("test_id")
     assert result is None
 
 
 def test_get_program_set_title_requests_exception(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    """Test get_program_set_title when requests.Session.get raises exception."""
+    """Test get_program_set_title when requests.Session.post raises exception."""
     client = AudiothekClient()
 
-    def _mock_requests_get_exception(self, *args, **kwargs):
+    def _mock_requests_post_exception(self, *args, **kwargs):
         raise requests.exceptions.RequestException("Network error")
 
-    monkeypatch.setattr("requests.Session.get", _mock_requests_get_exception)
+    monkeypatch.setattr("requests.Session.post", _mock_requests_post_exception)
 
     result = client.get_program_set_title("test_id")
     assert result is None
@@ -91,13 +91,13 @@ def test_get_program_set_title_missing_title_in_node(tmp_path: Path, monkeypatch
     """Test get_program_set_title when node exists but has no title."""
     client = AudiothekClient()
 
-    def _mock_requests_get_no_title(self, *args, **kwargs):
+    def _mock_requests_post_no_title(self, *args, **kwargs):
         class MockResponse:
             def json(self):
                 return {"data": {"result": {"items": {"nodes": [{"programSet": {}}]}}}}
         return MockResponse()
 
-    monkeypatch.setattr("requests.Session.get", _mock_requests_get_no_title)
+    monkeypatch.setattr("requests.Session.post", _mock_requests_post_no_title)
 
     result = client.get_program_set_title("test_id")
     assert result is None
@@ -107,7 +107,7 @@ def test_get_episode_title_with_valid_response(tmp_path: Path, monkeypatch: pyte
     """Test get_episode_title with valid API response."""
     client = AudiothekClient()
 
-    def _mock_requests_get_valid(self, *args, **kwargs):
+    def _mock_requests_post_valid(self, *args, **kwargs):
             class MockResponse:
                 def json(self):
                     return {
@@ -124,7 +124,7 @@ def test_get_episode_title_with_valid_response(tmp_path: Path, monkeypatch: pyte
                     pass
             return MockResponse()
 
-    monkeypatch.setattr("requests.Session.get", _mock_requests_get_valid)
+    monkeypatch.setattr("requests.Session.post", _mock_requests_post_valid)
 
     result = client.get_episode_title("test_id")
     assert result == "Test Program Title"
@@ -134,7 +134,7 @@ def test_get_program_set_title_with_valid_response(tmp_path: Path, monkeypatch:
     """Test get_program_set_title with valid API response."""
     client = AudiothekClient()
 
-    def _mock_requests_get_valid(self, *args, **kwargs):
+    def _mock_requests_post_valid(self, *args, **kwargs):
         class MockResponse:
             def json(self):
                 return {
@@ -157,7 +157,7 @@ def test_get_program_set_title_with_valid_response(tmp_path: Path, monkeypatch:
                 pass
         return MockResponse()
 
-    monkeypatch.setattr("requests.Session.get", _mock_requests_get_valid)
+    monkeypatch.setattr("requests.Session.post", _mock_requests_post_valid)
 
     result = client.get_program_set_title("test_id")
     assert result == "Test Program Set Title"
@@ -316,13 +316,7 @@ def test_save_collection_data_downloads_cover_image(tmp_path: Path, monkeypatch:
 
     # Mock requests.Session.get to simulate image download
     def _mock_get(self, url: str, timeout: int | None = None, **kwargs: Any):
-        class MockResponse:
-            def raise_for_status(self):
-                pass
-            @property
-            def content(self):
-                return b"fake_image_data"
-        return MockResponse()
+        return MockResponse(content=b"fake_image_data")
 
     monkeypatch.setattr("requests.Session.get", _mock_get)
 
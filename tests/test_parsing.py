@@ -50,3 +50,25 @@ def test_determine_resource_type_from_id_alphanumeric() -> None:
 
 def test_determine_resource_type_from_id_none() -> None:
     assert AudiothekClient.determine_resource_type_from_id("invalid_id") is None
+
+
+def test_resource_info_is_immutable_and_hashable() -> None:
+    info = AudiothekClient.determine_resource_type_from_id("ps1")
+
+    assert info is not None
+    assert not hasattr(info, "__dict__")
+    assert {info: True}[ResourceInfo(resource_type="program", resource_id="ps1")]
+    with pytest.raises(AttributeError):
+        info.resource_id = "ps2"  # type: ignore[misc]
+
+
+def test_parse_url_results_are_memoized() -> None:
+    AudiothekClient.parse_url.cache_clear()
+    url = "https://www.ardsounds.de/sendung/x/urn:ard:show:memo/"
+
+    first = AudiothekClient.parse_url(url)
+    second = AudiothekClient.parse_url(url)
+
+    assert first is second
+    assert AudiothekClient.parse_url.cache_info().hits == 1
+    assert AudiothekClient.determine_resource_type_from_id("urn:ard:show:memo") is AudiothekClient.determine_resource_type_from_id("urn:ard:show:memo")
@@ -1,5 +1,8 @@
 """Tests for utility functions."""
 
+import os
+from typing import Any
+
 import pytest
 
 from audiothek import sanitize_folder_name
@@ -84,3 +87,103 @@ def test_audiothek_downloader_initialization() -> None:
 
     # Test that client session is created
     assert downloader.client._session is not None
+
+
+def test_load_graphql_query_reads_each_file_once() -> None:
+    """Test that GraphQL query files are read once and then served from memory."""
+    from audiothek import load_graphql_query
+
+    load_graphql_query.cache_clear()
+    first = load_graphql_query("EpisodeQuery.graphql")
+    second = load_graphql_query("EpisodeQuery.graphql")
+
+    assert first is second
+    assert "query EpisodeQuery" in first
+    assert load_graphql_query.cache_info().hits == 1
+    assert load_graphql_query.cache_info().misses == 1
+
+
+def test_load_graphql_query_normalizes_whitespace_and_comments() -> None:
+    """Test that loaded queries are collapsed to a canonical single-line form."""
+    from graphql import parse, print_ast
+
+    from audiothek import load_graphql_query
+    from audiothek.utils import _GRAPHQL_DIR, _normalize_graphql_query
+
+    query = load_graphql_query("ProgramSetEpisodesQuery.graphql")
+    with open(os.path.join(_GRAPHQL_DIR, "ProgramSetEpisodesQuery.graphql"), encoding="utf-8") as f:
+        raw = f.read()
+
+    assert "\n" not in query
+    assert "  " not in query
+    assert print_ast(parse(query)) == print_ast(parse(raw))
+    assert _normalize_graphql_query("query Q {\n  # comment\n  result   { id }\n}\n") == "query Q { result { id } }"
+    assert _normalize_graphql_query('query Q {\n  result(title: "a  # b") { id }\n}\n') == 'query Q {\n  result(title: "a  # b") { id }\n}'
+
+
+# Episode fields read by the downloader (save_nodes, get_episode_metadata, audio URL selection)
+_CONSUMED_EPISODE_FIELDS = {
+    "id",
+    "title",
+    "description",
+    "summary",
+    "duration",
+    "publishDate",
+    "image.url",
+    "image.url1X1",
+    "programSet.id",
+    "programSet.title",
+    "programSet.path",
+    "audios.url",
+    "audios.downloadUrl",
+}
+
+
+def _selected_field_paths(selection_set: Any, prefix: str = "") -> set[str]:
+    """Return dotted paths of all leaf fields in a GraphQL selection set."""
+    paths: set[str] = set()
+    for selection in selection_set.selections:
+        path = prefix + selection.name.value
+        if selection.selection_set is None:
+            paths.add(path)
+        else:
+            paths |= _selected_field_paths(selection.selection_set, path + ".")
+    return paths
+
+
+def _find_selection(selection_set: Any, *names: str) -> Any:
+    """Walk down nested fields by response key and return the innermost selection set."""
+    for name in names:
+        selection_set = next(s for s in selection_set.selections if (s.alias or s.name).value == name).selection_set
+    return selection_set
+
+
+@pytest.mark.parametrize(
+    ("filename", "episode_path"),
+    [
+        ("EpisodeQuery.graphql", ("result",)),
+        ("ProgramSetEpisodesQuery.graphql", ("result", "items", "nodes")),
+        ("editorialCollection.graphql", ("result", "items", "nodes")),
+    ],
+)
+def test_episode_queries_only_select_consumed_fields(filename: str, episode_path: tuple[str, ...]) -> None:
+    """Test that episode selections don't request fields the downloader never reads."""
+    from graphql import parse
+
+    from audiothek import load_graphql_query
+
+    operation = parse(load_graphql_query(filename)).definitions[0]
+    episode_selection = _find_selection(operation.selection_set, *episode_path)
+
+    assert _selected_field_paths(episode_selection) <= _CONSUMED_EPISODE_FIELDS
+
+
+def test_sanitize_folder_name_is_memoized() -> None:
+    """Test that repeated program titles are sanitized once and then served from the cache."""
+    sanitize_folder_name.cache_clear()
+
+    assert sanitize_folder_name("Show: Title") == "Show_ Title"
+    assert sanitize_folder_name("Show: Title") == "Show_ Title"
+
+    assert sanitize_folder_name.cache_info().hits == 1
+    assert sanitize_folder_name.cache_info().misses == 1